@@ -140,8 +140,19 @@ __sessionid__ = blake2b(digest_size=2, salt=os.urandom(blake2b.SALT_SIZE)).hexdi
 # Set max. no. of lines for traceback info shown in prompt
 __tbcount__ = 5
 
-# Set checksum algorithm to be used
-__checksum_algorithm__ = sha1
+# Set size of the HDF5 chunk cache (in bytes) used when reading trials from
+# (chunked) datasets, such that consecutive trial reads don't re-read chunks
+__h5cache__ = int(os.environ.get("SPYH5CACHE", 64 * 1024**2))
+
+# Number of hash table slots of the HDF5 chunk cache (a prime, large enough
+# for the chunks fitting into `__h5cache__`)
+__h5slots__ = 10007
+
+# Set checksum algorithm to be used: prefer SIMD-accelerated BLAKE3 if available
+try:
+    from blake3 import blake3 as __checksum_algorithm__
+except ImportError:
+    __checksum_algorithm__ = sha1
 
 # Fill namespace
 from . import shared, io, datatype
@@ -475,7 +475,7 @@ class GrangerCausality(ComputationalRoutine):
         out.freq = data.freq
 
         # digest metadata and attach to .info property
-        mdata = metadata_from_hdf5_file(out.filename)
+        mdata = metadata_from_hdf5_file(out.data.file)
 
         for key, value in mdata.items():
             # we always have a (single) trial average here
@@ -8,7 +8,8 @@
 # Builtin/3rd party package imports
 import numpy as np
 import h5py
-from scipy.signal import fftconvolve, detrend
+from scipy.signal import detrend
+from scipy.fft import rfft, irfft, next_fast_len
 from inspect import signature
 from hashlib import blake2b
 
@@ -456,7 +457,7 @@ class CrossSpectra(ComputationalRoutine):
         propagate_properties(data, out, self.keeptrials)
 
         # General-purpose loading of metadata.
-        metadata = metadata_from_hdf5_file(out.filename)
+        metadata = metadata_from_hdf5_file(out.data.file)
         check_freq_hashes(metadata, out)
 
         out.freq = self.cfg["foi"]
@@ -562,15 +563,21 @@ def cross_covariance_cF(
     # re-normalize output for different effective overlaps
     norm_overlap = np.arange(nSamples, nSamples // 2, step=-1)
 
+    # transform every channel only once, padding avoids circular wrap-around
+    nFFT = next_fast_len(2 * nSamples - 1, real=True)
+    ftr = rfft(dat, n=nFFT, axis=0)
+    # the lags of a centered ('same' sized) cross-correlation,
+    # negative lags wrap around to the end of the inverse transform
+    same_idx = np.arange(-(nSamples // 2), nSamples - nSamples // 2) % nFFT
+
     CC = np.empty(outShape)
     for i in range(nChannels):
-        for j in range(i + 1):
-            cc12 = fftconvolve(dat[:, i], dat[::-1, j], mode="same")
-            CC[:, 0, i, j] = cc12[nSamples // 2 :] / norm_overlap
-            if i != j:
-                # cross-correlation is symmetric with C(tau) = C(-tau)^T
-                cc21 = cc12[::-1]
-                CC[:, 0, j, i] = cc21[nSamples // 2 :] / norm_overlap
+        # cross-correlations with all channels j <= i at once
+        cc12 = irfft(ftr[:, [i]] * ftr[:, : i + 1].conj(), n=nFFT, axis=0)[same_idx]
+        CC[:, 0, i, : i + 1] = cc12[nSamples // 2 :] / norm_overlap[:, np.newaxis]
+        # cross-correlation is symmetric with C(tau) = C(-tau)^T
+        cc21 = cc12[::-1, :i]
+        CC[:, 0, :i, i] = cc21[nSamples // 2 :] / norm_overlap[:, np.newaxis]
 
     # normalize with products of std
     if norm:
@@ -637,5 +644,5 @@ class CrossCovariance(ComputationalRoutine):
 
         # Attach remaining meta-data
         out.samplerate = data.samplerate
-        out.channel_i = np.array(data.channel[chanSec])
-        out.channel_j = np.array(data.channel[chanSec])
+        out.channel_i = data.channel[chanSec]
+        out.channel_j = data.channel[chanSec]
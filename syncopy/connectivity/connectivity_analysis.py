@@ -190,7 +190,7 @@ def connectivityanalysis(
         Frequency-window ``[fmin, fmax]`` (in Hz) of interest. The
         `foi` array will be constructed in 1Hz steps from `fmin` to
         `fmax` (inclusive).
-    pad : 'maxperlen', float or 'nextpow2' -
+    pad : 'maxperlen', float, 'nextpow2' or 'nextfastlen' -
         For the default ``'maxperlen'``, no padding is performed in case of equal
         length trials, while trials of varying lengths are padded to match the
         longest trial. If ``pad`` is a number all trials are padded so that ``pad`` indicates
@@ -198,7 +198,9 @@ def connectivityanalysis(
         ``pad = 2`` pads all trials to an absolute length of 2000 samples, if and
         only if the longest trial contains at maximum 2000 samples and the
         samplerate is 1kHz. If ``pad`` is ``'nextpow2'`` all trials are padded to the
-        nearest power of two (in samples) of the longest trial.
+        nearest power of two (in samples) of the longest trial. For
+        ``'nextfastlen'`` all trials are padded to the nearest length (in samples)
+        for which the FFT is efficient, typically much shorter than ``'nextpow2'``.
     channelcmb : [senders, receivers], list of array like, optional
         Two sequences ``senders`` and ``receivers`` encoding channel names or indices.
         such that connectivity measure gets computed only for those (senders x receivers)
@@ -66,7 +66,7 @@ def wilson_sf(CSD, nIter=100, rtol=1e-6, direct_inversion=True):
     psi0 = _psi0_initial(CSD)
 
     # initial choice of psi, constant for all z(~f)
-    psi = np.tile(psi0, (nFreq, 1, 1))
+    psi = np.broadcast_to(psi0, (nFreq,) + psi0.shape)
     # attach negative frequencies
     psi = np.r_[psi, psi[nFreq - 2 : 0 : -1].conj()]
 
@@ -97,6 +97,7 @@ class BaseData(ABC):
     _filename = None
     _trialdefinition = None
     _dimord = None
+    _dimIndex = None
     _mode = None
     _lhd = (
         "\n\t\t>>> SyNCopy v. {ver:s} <<< \n\n"
@@ -128,11 +129,8 @@ class BaseData(ABC):
 
     @property
     def _stackingDim(self):
-        if any(["DiscreteData" in str(base) for base in self.__class__.__mro__]):
-            return 0
-        else:
-            if self._stackingDimLabel is not None and self.dimord is not None:
-                return self.dimord.index(self._stackingDimLabel)
+        if self._stackingDimLabel is not None and self._dimIndex is not None:
+            return self._dimIndex[self._stackingDimLabel]
 
     @property
     def cfg(self):
@@ -531,7 +529,7 @@ class BaseData(ABC):
                 lgl = "NumPy arrays of identical shape"
                 act = "NumPy arrays with mismatching shapes"
                 raise SPYValueError(legal=lgl, varname="data", actual=act)
-            trialLens = [val.shape[self.dimord.index("time")] for val in inData]
+            trialLens = [val.shape[self._dimIndex["time"]] for val in inData]
 
         else:
 
@@ -544,7 +542,7 @@ class BaseData(ABC):
                 lgl = "NumPy 2d-arrays with {} columns".format(nCol)
                 act = "NumPy arrays of different shape"
                 raise SPYValueError(legal=lgl, varname="data", actual=act)
-            trialLens = [np.nanmax(val[:, self.dimord.index("sample")]) for val in inData]
+            trialLens = [np.nanmax(val[:, self._dimIndex["sample"]]) for val in inData]
 
         nTrials = len(trialLens)
 
@@ -846,6 +844,7 @@ class BaseData(ABC):
 
         if dims is None:
             self._dimord = None
+            self._dimIndex = None
             return
 
         # this enforces the _defaultDimord
@@ -864,6 +863,8 @@ class BaseData(ABC):
         # Canonical way to perform initial allocation of dimensional properties
         # (`self._channel = None`, `self._freq = None` etc.)
         self._dimord = list(dims)
+        # axis lookup table, queried for every trial access
+        self._dimIndex = {dim: idx for idx, dim in enumerate(self._dimord)}
         for dim in [dlabel for dlabel in dims if dlabel != "time"]:
             setattr(self, "_" + dim, None)
 
@@ -23,7 +23,7 @@ from syncopy.shared.errors import SPYValueError, SPYError
 from syncopy.shared.tools import best_match
 from syncopy.plotting import sp_plotting, mp_plotting
 from syncopy.io.nwb import _analog_timelocked_to_nwbfile
-from .util import TimeIndexer
+from .util import TimeIndexer, default_labels
 
 
 from syncopy import __pynwb__
@@ -51,6 +51,7 @@ class ContinuousData(BaseData, ABC):
     _hdfFileDatasetProperties = BaseData._hdfFileDatasetProperties + ("data",)
     # all continuous data types have a time axis
     _selectionKeyWords = BaseData._selectionKeyWords + ("latency",)
+    _sampleinfoCache = None
 
     @property
     def data(self):
@@ -61,8 +62,10 @@ class ContinuousData(BaseData, ABC):
         Trials are concatenated along the time axis.
         """
 
-        if getattr(self._data, "id", None) is not None:
-            if self._data.id.valid == 0:
+        # look up the HDF5 id only once
+        dsetId = getattr(self._data, "id", None)
+        if dsetId is not None:
+            if not dsetId.valid:
                 lgl = "open HDF5 file"
                 act = "backing HDF5 file {} has been closed"
                 raise SPYValueError(legal=lgl, actual=act.format(self.filename), varname="data")
@@ -90,20 +93,17 @@ class ContinuousData(BaseData, ABC):
         return True
 
     def __str__(self):
-        # Get list of print-worthy attributes
-        ppattrs = [
-            attr
-            for attr in self.__dir__()
-            if not (attr.startswith("_") or attr in ["log", "trialdefinition"])
-        ]
-        ppattrs = [
-            attr
-            for attr in ppattrs
-            if not (inspect.ismethod(getattr(self, attr)) or isinstance(getattr(self, attr), Iterator))
-        ]
+        # Get print-worthy attributes, evaluate (potentially costly) properties only once
+        ppvalues = {}
+        for attr in self.__dir__():
+            if attr.startswith("_") or attr in ["log", "trialdefinition"]:
+                continue
+            value = getattr(self, attr)
+            if not (inspect.ismethod(value) or isinstance(value, Iterator)):
+                ppvalues[attr] = value
         if self.__class__.__name__ == "CrossSpectralData":
-            ppattrs.remove("channel")
-        ppattrs.sort()
+            ppvalues.pop("channel")
+        ppattrs = sorted(ppvalues)
 
         # Construct string for pretty-printing class attributes
         dsep = " by "
@@ -112,14 +112,14 @@ class ContinuousData(BaseData, ABC):
         maxKeyLength = max([len(k) for k in ppattrs])
         printString = "{0:>" + str(maxKeyLength + 5) + "} : {1:}\n"
         for attr in ppattrs:
-            value = getattr(self, attr)
+            value = ppvalues[attr]
             if hasattr(value, "shape") and attr == "data" and self.sampleinfo is not None:
                 tlen = np.unique(np.diff(self.sampleinfo))
                 if tlen.size == 1:
                     trlstr = "of length {} ".format(str(tlen[0]))
                 else:
                     trlstr = ""
-                dsize = np.prod(self.data.shape) * self.data.dtype.itemsize / 1024**2
+                dsize = value.size * value.dtype.itemsize / 1024**2
                 dunit = "MB"
                 if dsize > 1000:
                     dsize /= 1024
@@ -132,8 +132,8 @@ class ContinuousData(BaseData, ABC):
                     + "of size {sz:3.2f} {szu:s}"
                 )
                 valueString = valueString.format(
-                    dt=self.data.dtype.name,
-                    tp=self.data.__class__.__name__,
+                    dt=value.dtype.name,
+                    tp=value.__class__.__name__,
                     sz=dsize,
                     szu=dunit,
                 )
@@ -163,19 +163,18 @@ class ContinuousData(BaseData, ABC):
     @property
     def _shapes(self):
         if self.sampleinfo is not None:
-            shp = [list(self.data.shape) for k in range(self.sampleinfo.shape[0])]
-            for k, sg in enumerate(self.sampleinfo):
-                shp[k][self._stackingDim] = sg[1] - sg[0]
-            return [tuple(sp) for sp in shp]
+            shp = np.tile(self.data.shape, (self.sampleinfo.shape[0], 1))
+            shp[:, self._stackingDim] = np.diff(self.sampleinfo, axis=1)[:, 0]
+            return [tuple(sp) for sp in shp.tolist()]
 
     @property
     def channel(self):
         """:class:`numpy.ndarray` : list of recording channel names"""
         # if data exists but no user-defined channel labels, create them on the fly
         if self._channel is None and self._data is not None:
-            nChannel = self.data.shape[self.dimord.index("channel")]
+            nChannel = self.data.shape[self._dimIndex["channel"]]
             # default labels
-            return np.array(["channel" + str(i + 1).zfill(len(str(nChannel))) for i in range(nChannel)])
+            return default_labels("channel", nChannel)
         return self._channel
 
     @channel.setter
@@ -194,7 +193,7 @@ class ContinuousData(BaseData, ABC):
             channel,
             varname="channel",
             ntype="str",
-            dims=(self.data.shape[self.dimord.index("channel")],),
+            dims=(self.data.shape[self._dimIndex["channel"]],),
         )
 
         self._channel = np.array(channel)
@@ -221,10 +220,10 @@ class ContinuousData(BaseData, ABC):
 
         # all-to-all trialdefinition
         if trldef is None:
-            self._trialdefinition = np.array([[0, self.data.shape[self.dimord.index("time")], 0]])
+            self._trialdefinition = np.array([[0, self.data.shape[self._dimIndex["time"]], 0]])
             self._trial_ids = [0]
         else:
-            scount = self.data.shape[self.dimord.index("time")]
+            scount = self.data.shape[self._dimIndex["time"]]
             array_parser(trldef, varname="trialdefinition", dims=2)
             if trldef.shape[-1] < 3:
                 lgl = "trialdefinition with at least 3 columns: [start, stop, offset]"
@@ -251,10 +250,18 @@ class ContinuousData(BaseData, ABC):
         if self.samplerate is not None and self.sampleinfo is not None:
             return self._time
 
+    # Helper function that returns [start, stop) sample indices of a trial as
+    # Python ints, converted only once for all trials of a trialdefinition
+    def _trial_bounds(self, trialno):
+        trldef = self._trialdefinition
+        if self._sampleinfoCache is None or self._sampleinfoCache[0] is not trldef:
+            self._sampleinfoCache = (trldef, trldef[:, :2].astype(np.intp).tolist())
+        return self._sampleinfoCache[1][trialno]
+
     # Helper function that grabs a single trial
     def _get_trial(self, trialno):
         idx = [slice(None)] * len(self.dimord)
-        idx[self._stackingDim] = slice(int(self.sampleinfo[trialno, 0]), int(self.sampleinfo[trialno, 1]))
+        idx[self._stackingDim] = slice(*self._trial_bounds(trialno))
         return self._data[tuple(idx)]
 
     def _is_empty(self):
@@ -289,18 +296,21 @@ class ContinuousData(BaseData, ABC):
         syncopy.datatype.base_data.FauxTrial : class definition and further details
         syncopy.shared.computational_routine.ComputationalRoutine : Syncopy compute engine
         """
+        # resolve (property-based) attributes only once
+        stackDim = self._stackingDim
+        selection = self.selection
+
         shp = list(self.data.shape)
         idx = [slice(None)] * len(self.dimord)
-        stop = int(self.sampleinfo[trialno, 1])
-        start = int(self.sampleinfo[trialno, 0])
-        shp[self._stackingDim] = stop - start
-        idx[self._stackingDim] = slice(start, stop)
+        start, stop = self._trial_bounds(trialno)
+        shp[stackDim] = stop - start
+        idx[stackDim] = slice(start, stop)
 
         # process existing data selections
-        if self.selection is not None:
+        if selection is not None:
 
             # time-selection is most delicate due to trial-offset
-            tsel = self.selection.time[trialno]
+            tsel = selection.time[trialno]
             if isinstance(tsel, slice):
                 if tsel.start is not None:
                     tstart = tsel.start
@@ -314,34 +324,24 @@ class ContinuousData(BaseData, ABC):
                 # account for trial offsets and compute slicing index + shape
                 start = start + tstart
                 stop = start + (tstop - tstart)
-                idx[self._stackingDim] = slice(start, stop)
-                shp[self._stackingDim] = stop - start
+                idx[stackDim] = slice(start, stop)
+                shp[stackDim] = stop - start
 
             else:
-                idx[self._stackingDim] = [tp + start for tp in tsel]
-                shp[self._stackingDim] = len(tsel)
+                idx[stackDim] = [tp + start for tp in tsel]
+                shp[stackDim] = len(tsel)
 
             # process the rest
-            dims = list(self.dimord)
-            dims.pop(self._stackingDim)
-            for dim in dims:
-                sel = getattr(self.selection, dim)
+            for dim, dimIdx in self._dimIndex.items():
+                if dimIdx == stackDim:
+                    continue
+                sel = getattr(selection, dim)
                 if sel is not None:
-                    dimIdx = self.dimord.index(dim)
                     idx[dimIdx] = sel
                     if isinstance(sel, slice):
-                        begin, end, delta = sel.start, sel.stop, sel.step
-                        if sel.start is None:
-                            begin = 0
-                        elif sel.start < 0:
-                            begin = shp[dimIdx] + sel.start
-                        if sel.stop is None:
-                            end = shp[dimIdx]
-                        elif sel.stop < 0:
-                            end = shp[dimIdx] + sel.stop
-                        if sel.step is None:
-                            delta = 1
-                        shp[dimIdx] = int(np.ceil((end - begin) / delta))
+                        # resolve `None`/negative bounds w.r.t. the axis length
+                        begin, end, delta = sel.indices(shp[dimIdx])
+                        shp[dimIdx] = len(range(begin, end, delta))
                         idx[dimIdx] = slice(begin, end, delta)
                     elif isinstance(sel, list):
                         shp[dimIdx] = len(sel)
@@ -559,8 +559,8 @@ class SpectralData(ContinuousData):
     def taper(self):
         """:class:`numpy.ndarray` : list of window functions used"""
         if self._taper is None and self._data is not None:
-            nTaper = self.data.shape[self.dimord.index("taper")]
-            return np.array(["taper" + str(i + 1).zfill(len(str(nTaper))) for i in range(nTaper)])
+            nTaper = self.data.shape[self._dimIndex["taper"]]
+            return default_labels("taper", nTaper)
         return self._taper
 
     @taper.setter
@@ -576,7 +576,7 @@ class SpectralData(ContinuousData):
         try:
             array_parser(
                 tpr,
-                dims=(self.data.shape[self.dimord.index("taper")],),
+                dims=(self.data.shape[self._dimIndex["taper"]],),
                 varname="taper",
                 ntype="str",
             )
@@ -590,7 +590,7 @@ class SpectralData(ContinuousData):
         """:class:`numpy.ndarray`: frequency axis in Hz"""
         # if data exists but no user-defined frequency axis, create one on the fly
         if self._freq is None and self._data is not None:
-            return np.arange(self.data.shape[self.dimord.index("freq")])
+            return np.arange(self.data.shape[self._dimIndex["freq"]])
         return self._freq
 
     @freq.setter
@@ -609,7 +609,7 @@ class SpectralData(ContinuousData):
             varname="freq",
             hasnan=False,
             hasinf=False,
-            dims=(self.data.shape[self.dimord.index("freq")],),
+            dims=(self.data.shape[self._dimIndex["freq"]],),
         )
         self._freq = np.array(freq)
 
@@ -752,8 +752,8 @@ class CrossSpectralData(ContinuousData):
         """:class:`numpy.ndarray` : list of recording channel names"""
         # if data exists but no user-defined channel labels, create them on the fly
         if self._channel_i is None and self._data is not None:
-            nChannel = self.data.shape[self.dimord.index("channel_i")]
-            return np.array(["channel" + str(i + 1).zfill(len(str(nChannel))) for i in range(nChannel)])
+            nChannel = self.data.shape[self._dimIndex["channel_i"]]
+            return default_labels("channel", nChannel)
 
         return self._channel_i
 
@@ -774,7 +774,7 @@ class CrossSpectralData(ContinuousData):
                 channel_i,
                 varname="channel_i",
                 ntype="str",
-                dims=(self.data.shape[self.dimord.index("channel_i")],),
+                dims=(self.data.shape[self._dimIndex["channel_i"]],),
             )
         except Exception as exc:
             raise exc
@@ -786,8 +786,8 @@ class CrossSpectralData(ContinuousData):
         """:class:`numpy.ndarray` : list of recording channel names"""
         # if data exists but no user-defined channel labels, create them on the fly
         if self._channel_j is None and self._data is not None:
-            nChannel = self.data.shape[self.dimord.index("channel_j")]
-            return np.array(["channel" + str(i + 1).zfill(len(str(nChannel))) for i in range(nChannel)])
+            nChannel = self.data.shape[self._dimIndex["channel_j"]]
+            return default_labels("channel", nChannel)
 
         return self._channel_j
 
@@ -808,7 +808,7 @@ class CrossSpectralData(ContinuousData):
                 channel_j,
                 varname="channel_j",
                 ntype="str",
-                dims=(self.data.shape[self.dimord.index("channel_j")],),
+                dims=(self.data.shape[self._dimIndex["channel_j"]],),
             )
         except Exception as exc:
             raise exc
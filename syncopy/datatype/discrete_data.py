@@ -12,9 +12,10 @@ import inspect
 
 # Local imports
 from .base_data import BaseData, FauxTrial
+from .util import indexed_labels
 from .methods.definetrial import definetrial
 from syncopy.shared.parsers import scalar_parser, array_parser
-from syncopy.shared.errors import SPYValueError, SPYError, SPYTypeError
+from syncopy.shared.errors import SPYValueError, SPYError, SPYTypeError, SPYWarning
 from syncopy.plotting import spike_plotting
 
 from syncopy.io.nwb import _spikedata_to_nwbfile
@@ -49,8 +50,10 @@ class DiscreteData(BaseData, ABC):
         Trials are concatenated along the time axis.
         """
 
-        if getattr(self._data, "id", None) is not None:
-            if self._data.id.valid == 0:
+        # look up the HDF5 id only once
+        dsetId = getattr(self._data, "id", None)
+        if dsetId is not None:
+            if not dsetId.valid:
                 lgl = "open HDF5 file"
                 act = "backing HDF5 file {} has been closed"
                 raise SPYValueError(legal=lgl, actual=act.format(self.filename), varname="data")
@@ -61,26 +64,38 @@ class DiscreteData(BaseData, ABC):
         """Also checks for integer type of data"""
         # this comes from BaseData
         self._set_dataset_property(inData, "data")
+        # largest sample index gets re-computed from new data
+        self._sampleMax = None
 
         if inData is not None:
             if not np.issubdtype(self.data.dtype, np.integer):
                 raise SPYTypeError(self.data.dtype, "data", "integer like")
 
+    @property
+    def _stackingDim(self):
+        # samples (rows) are always stacked
+        return 0
+
+    @property
+    def _maxSample(self):
+        """Largest sample index in `data`, scanning the column only once"""
+        if self._sampleMax is None:
+            self._sampleMax = np.max(self.data[:, self._dimIndex["sample"]])
+        return self._sampleMax
+
     def __str__(self):
-        # Get list of print-worthy attributes
-        ppattrs = [
-            attr
-            for attr in self.__dir__()
-            if not (attr.startswith("_") or attr in ["log", "trialdefinition"])
-        ]
-        ppattrs = [
-            attr
-            for attr in ppattrs
-            if hasattr(self, attr)
-            and not (inspect.ismethod(getattr(self, attr)) or isinstance(getattr(self, attr), Iterator))
-        ]
-
-        ppattrs.sort()
+        # Get print-worthy attributes, evaluate (potentially costly) properties only once
+        ppvalues = {}
+        for attr in self.__dir__():
+            if attr.startswith("_") or attr in ["log", "trialdefinition"]:
+                continue
+            try:
+                value = getattr(self, attr)
+            except AttributeError:
+                continue
+            if not (inspect.ismethod(value) or isinstance(value, Iterator)):
+                ppvalues[attr] = value
+        ppattrs = sorted(ppvalues)
 
         # Construct string for pretty-printing class attributes
         dsep = " by "
@@ -89,14 +104,14 @@ class DiscreteData(BaseData, ABC):
         maxKeyLength = max([len(k) for k in ppattrs])
         printString = "{0:>" + str(maxKeyLength + 5) + "} : {1:}\n"
         for attr in ppattrs:
-            value = getattr(self, attr)
+            value = ppvalues[attr]
             if hasattr(value, "shape") and attr == "data" and self.sampleinfo is not None:
-                tlen = np.unique([sinfo[1] - sinfo[0] for sinfo in self.sampleinfo])
+                tlen = np.unique(np.diff(self.sampleinfo))
                 if tlen.size == 1:
                     trlstr = "of length {} ".format(str(tlen[0]))
                 else:
                     trlstr = ""
-                dsize = np.prod(self.data.shape) * self.data.dtype.itemsize / 1024**2
+                dsize = value.size * value.dtype.itemsize / 1024**2
                 dunit = "MB"
                 if dsize > 1000:
                     dsize /= 1024
@@ -109,8 +124,8 @@ class DiscreteData(BaseData, ABC):
                     + "of size {sz:3.2f} {szu:s}"
                 )
                 valueString = valueString.format(
-                    dt=self.data.dtype.name,
-                    tp=self.data.__class__.__name__,
+                    dt=value.dtype.name,
+                    tp=value.__class__.__name__,
                     sz=dsize,
                     szu=dunit,
                 )
@@ -142,7 +157,7 @@ class DiscreteData(BaseData, ABC):
         """Indices of all recorded samples"""
         if self.data is None:
             return None
-        return self.data[:, self.dimord.index("sample")]
+        return self.data[:, self._dimIndex["sample"]]
 
     @property
     def samplerate(self):
@@ -155,19 +170,16 @@ class DiscreteData(BaseData, ABC):
             self._samplerate = None
             return
 
-        try:
-            scalar_parser(sr, varname="samplerate", lims=[1, np.inf])
-        except Exception as exc:
-            raise exc
+        scalar_parser(sr, varname="samplerate", lims=[1, np.inf])
         self._samplerate = sr
 
     @BaseData.trialdefinition.setter
     def trialdefinition(self, trldef):
 
         if trldef is None:
-            sidx = self.dimord.index("sample")
+            sidx = self._dimIndex["sample"]
             self._trialdefinition = np.array(
-                [[np.nanmin(self.data[:, sidx]), np.nanmax(self.data[:, sidx]), 0]]
+                [[np.min(self.data[:, sidx]), self._maxSample, 0]]
             )
             self._trial_ids = [0]
         else:
@@ -182,9 +194,8 @@ class DiscreteData(BaseData, ABC):
             )
 
             self._trialdefinition = trldef.copy()
-            self._triald_ids = np.arange(self.sampleinfo.shape[0])
             # Compute trial-IDs by matching data samples with provided trial-bounds
-            samples = self.data[:, self.dimord.index("sample")]
+            samples = self.data[:, self._dimIndex["sample"]]
             idx = np.searchsorted(samples, self.sampleinfo.ravel())
             idx = idx.reshape(self.sampleinfo.shape)
 
@@ -199,10 +210,13 @@ class DiscreteData(BaseData, ABC):
     def time(self):
         """list(float): trigger-relative time of each event"""
         if self.samplerate is not None and self.sampleinfo is not None:
+            # read the sample column only once, and shift all samples w.r.t.
+            # their trial's start and offset in one go
+            samples = self.data[:, self._dimIndex["sample"]]
+            shifts = self._t0 - self.sampleinfo[:, 0]
             return [
-                (trl[:, self.dimord.index("sample")] - self.sampleinfo[tk, 0] + self.trialdefinition[tk, 2])
-                / self.samplerate
-                for tk, trl in enumerate(self.trials)
+                (samples[trlSlice] + shifts[tk]) / self.samplerate
+                for tk, trlSlice in enumerate(self._trialslice)
             ]
 
     @property
@@ -221,26 +235,21 @@ class DiscreteData(BaseData, ABC):
             return
 
         if self.data is None:
-            SPYError(
-                "SyNCoPy core - trialid: Cannot assign `trialid` without data. " + "Please assign data first"
-            )
+            SPYWarning("Cannot assign `trialid` without data. Please assign data first")
             return
         if (self.data.shape[0] == 0) and (trlid.shape[0] == 0):
             self._trialid = np.array(trlid, dtype=int)
             return
-        scount = np.nanmax(self.data[:, self.dimord.index("sample")])
-        try:
-            array_parser(
-                trlid,
-                varname="trialid",
-                dims=(self.data.shape[0],),
-                hasnan=False,
-                hasinf=False,
-                ntype="int_like",
-                lims=[-1, scount],
-            )
-        except Exception as exc:
-            raise exc
+        scount = self._maxSample
+        array_parser(
+            trlid,
+            varname="trialid",
+            dims=(self.data.shape[0],),
+            hasnan=False,
+            hasinf=False,
+            ntype="int_like",
+            lims=[-1, scount],
+        )
         self._trialid = np.array(trlid, dtype=int)
 
     @property
@@ -249,7 +258,7 @@ class DiscreteData(BaseData, ABC):
         if self.samplerate is not None and self.sampleinfo is not None:
             sample0 = self.sampleinfo[:, 0] - self._t0
             sample0 = np.append(sample0, np.nan)[self.trialid]
-            return (self.data[:, self.dimord.index("sample")] - sample0) / self.samplerate
+            return (self.data[:, self._dimIndex["sample"]] - sample0) / self.samplerate
 
     # Helper function that grabs a single trial
     def _get_trial(self, trialno):
@@ -306,6 +315,7 @@ class DiscreteData(BaseData, ABC):
         self._trialid = None
         self._samplerate = None
         self._data = None
+        self._sampleMax = None
 
         self.samplerate = samplerate
         self.trialid = trialid
@@ -387,8 +397,8 @@ class SpikeData(DiscreteData):
             return
 
         # this is costly and loads the entire hdf5 dataset into memory!
-        self.channel_idx = np.unique(self.data[:, self.dimord.index("channel")])
-        self.unit_idx = np.unique(self.data[:, self.dimord.index("unit")])
+        self.channel_idx = np.unique(self.data[:, self._dimIndex["channel"]])
+        self.unit_idx = np.unique(self.data[:, self._dimIndex["unit"]])
 
     @property
     def channel(self):
@@ -436,10 +446,7 @@ class SpikeData(DiscreteData):
 
         # channel entries in self.data are 0-based
         chan_max = self.channel_idx.max()
-        channel_labels = np.array(
-            ["channel" + str(int(i + 1)).zfill(len(str(chan_max))) for i in self.channel_idx]
-        )
-        return channel_labels
+        return indexed_labels("channel", self.channel_idx, len(str(chan_max)))
 
     @property
     def unit(self):
@@ -493,7 +500,7 @@ class SpikeData(DiscreteData):
         """
 
         unit_max = self.unit_idx.max()
-        return np.array(["unit" + str(int(i + 1)).zfill(len(str(unit_max))) for i in self.unit_idx])
+        return indexed_labels("unit", self.unit_idx, len(str(unit_max)))
 
     # Helper function that extracts by-trial unit-indices
     def _get_unit(self, trials, units=None):
@@ -529,7 +536,7 @@ class SpikeData(DiscreteData):
         if units is not None:
             indices = []
             for trlno in trials:
-                thisTrial = self.data[self._trialslice[trlno], self.dimord.index("unit")]
+                thisTrial = self.data[self._trialslice[trlno], self._dimIndex["unit"]]
                 trialUnits = []
                 for unit in units:
                     trialUnits += list(np.where(thisTrial == unit)[0])
@@ -734,7 +741,16 @@ class EventData(DiscreteData):
         """numpy.ndarray(int): integer event code assocated with each event"""
         if self.data is None:
             return None
-        return np.unique(self.data[:, self.dimord.index("eventid")])
+        # scanning the whole dataset is costly, do it only once
+        if self._eventid is None:
+            self._eventid = np.unique(self.data[:, self._dimIndex["eventid"]])
+        return self._eventid
+
+    @DiscreteData.data.setter
+    def data(self, inData):
+        DiscreteData.data.fset(self, inData)
+        # event codes get re-computed from new data
+        self._eventid = None
 
     # Helper function that extracts by-trial eventid-indices
     def _get_eventid(self, trials, eventids=None):
@@ -770,7 +786,7 @@ class EventData(DiscreteData):
         if eventids is not None:
             indices = []
             for trlno in trials:
-                thisTrial = self.data[self._trialslice[trlno], self.dimord.index("eventid")]
+                thisTrial = self.data[self._trialslice[trlno], self._dimIndex["eventid"]]
                 trialEvents = []
                 for event in eventids:
                     trialEvents += list(np.where(thisTrial == event)[0])
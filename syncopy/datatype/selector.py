@@ -801,7 +801,7 @@ class Selector:
             if self._dataClass == "SpikeData":
                 chanIdx = data.dimord.index("channel")
                 wantedChannels = data.channel_idx[self.channel]
-                chanPerTrial = []
+                chanPerTrial = [None] * len(self.trial_ids)
 
             for tk, trialno in enumerate(self.trial_ids):
                 trialArr = np.arange(data._trialslice[trialno].stop - data._trialslice[trialno].start)
@@ -822,7 +822,7 @@ class Selector:
                     rawChanInTrial = data.trials[trialno][:, chanIdx]
                     chanTrlIdx = np.flatnonzero(np.isin(rawChanInTrial, wantedChannels))
                     combinedSelect = combinedSelect[np.isin(combinedSelect, chanTrlIdx)].tolist()
-                    chanPerTrial.append(rawChanInTrial[combinedSelect])
+                    chanPerTrial[tk] = rawChanInTrial[combinedSelect]
                 elif areShuffled:
                     combinedSelect = combinedSelect.tolist()
 
@@ -948,7 +948,7 @@ class SelectionTimeIndexer:
         self.idx_set = set(idx_list)
         self._len = len(idx_list)
 
-        if any(["DiscreteData" in str(base) for base in self.__class__.__mro__]):
+        if any(["DiscreteData" in str(base) for base in data_object.__class__.__mro__]):
             self.is_discrete = True
             self.trialtime = data_object.trialtime
         else:
@@ -963,6 +963,9 @@ class SelectionTimeIndexer:
 
         # continuous data
         elif not self.is_discrete:
+            start, stop = self._sample_bounds(trialno)
+            if start < stop:
+                return np.s_[start:stop:1]
             _, selTime = best_match(self.data_object.time[trialno], self.toilim, span=True)
             return np.s_[selTime[0] : selTime[-1] + 1 : 1]
         # discrete data
@@ -971,6 +974,33 @@ class SelectionTimeIndexer:
             _, selTime = best_match(trlTime, self.toilim, span=True)
             return np.s_[selTime[0] : selTime[-1] + 1 : 1]
 
+    def _sample_bounds(self, trialno):
+        """
+        Sample indices [start, stop) of the continuous trial `trialno` with
+        time points inside the closed `toilim` interval, computed from the
+        trial's offset and length without constructing its time axis
+        """
+        start, stop, offset = self.data_object._trialdefinition[trialno, :3]
+        nSamples = int(stop - start)
+        samplerate = self.data_object.samplerate
+
+        # time of k-th sample, same arithmetic as `TimeIndexer`
+        def tk(k):
+            return (np.float64(k) + offset) / samplerate
+
+        # estimate interval bounds, then correct for floating point round-off
+        lo = int(min(max(np.ceil(self.toilim[0] * samplerate - offset), 0), nSamples))
+        while lo > 0 and tk(lo - 1) >= self.toilim[0]:
+            lo -= 1
+        while lo < nSamples and tk(lo) < self.toilim[0]:
+            lo += 1
+        hi = int(min(max(np.floor(self.toilim[1] * samplerate - offset) + 1, 0), nSamples))
+        while hi < nSamples and tk(hi) <= self.toilim[1]:
+            hi += 1
+        while hi > 0 and tk(hi - 1) > self.toilim[1]:
+            hi -= 1
+        return lo, hi
+
     def __getitem__(self, trialno):
         # single trial access via index operator []
         if not isinstance(trialno, Number):
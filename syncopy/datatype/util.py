@@ -3,6 +3,7 @@ Helpers and tools for Syncopy data classes
 """
 
 import os
+import functools
 from numbers import Number
 import numpy as np
 
@@ -82,7 +83,11 @@ class TimeIndexer:
     def construct_time_array(self, trialno):
 
         start, stop, offset = self.trialdefinition[trialno, :3]
-        return (np.arange(0, stop - start) + offset) / self.samplerate
+        # shift and scale the sample ramp in-place, no temporaries
+        time = np.arange(0, stop - start, dtype=np.float64)
+        time += offset
+        time /= self.samplerate
+        return time
 
     def __getitem__(self, trialno):
         # single trial access via index operator []
@@ -109,6 +114,32 @@ class TimeIndexer:
         return "{} element iterable".format(self._len)
 
 
+@functools.lru_cache(maxsize=32)
+def default_labels(prefix, nLabels):
+    """
+    Zero-padded default labels, e.g. `['channel01', ..., 'channel10']`
+
+    The (read-only) array is cached, as data objects without
+    user-defined labels generate them on every property access.
+    """
+    numbers = np.arange(1, nLabels + 1).astype(str)
+    labels = np.char.add(prefix, np.char.zfill(numbers, len(str(nLabels))))
+    labels.flags.writeable = False
+    return labels
+
+
+def indexed_labels(prefix, indices, width):
+    """
+    Labels `prefix` + 1-based `indices`, zero-padded to at least `width` digits
+
+    Unlike `str.zfill`, `np.char.zfill` truncates strings longer than `width`,
+    so only the shorter entries get padded.
+    """
+    numbers = (np.asarray(indices).astype(np.int64) + 1).astype(str)
+    numbers = np.where(np.char.str_len(numbers) < width, np.char.zfill(numbers, width), numbers)
+    return np.char.add(prefix, numbers)
+
+
 def get_dir_size(start_path=".", out="byte"):
     """
     Compute size of all files in directory (and its subdirectories), in bytes or GB.
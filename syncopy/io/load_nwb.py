@@ -206,7 +206,7 @@ def load_nwb(
             lgl = "acquisition timings defined by `starting_time` and `rate`"
             act = "`starting_time` or `rate` not set"
             raise SPYValueError(lgl, varname="starting_time/rate", actual=act)
-        if np.unique(tStarts).size > 1 or np.unique(sRates).size > 1:
+        if len(set(tStarts)) > 1 or len(set(sRates)) > 1:
             lgl = "acquisitions with unique `starting_time` and `rate`"
             act = "`starting_time` or `rate` different across acquisitions"
             raise SPYValueError(lgl, varname="starting_time/rate", actual=act)
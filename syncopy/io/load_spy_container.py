@@ -273,7 +273,7 @@ def _load(filename, checksum, mode, out):
     # If wanted, perform checksum matching
     if checksum:
         hsh_msg = "hash = {hsh:s}"
-        hsh = hash_file(hdfFile)
+        hsh = hash_file(hdfFile, algorithm=jsonDict["checksum_algorithm"])
         if hsh != jsonDict["file_checksum"]:
             raise SPYValueError(
                 legal=hsh_msg.format(hsh=jsonDict["file_checksum"]),
@@ -310,7 +310,13 @@ def _load(filename, checksum, mode, out):
     for datasetProperty in out._hdfFileDatasetProperties:
         targetProperty = datasetProperty if datasetProperty == "data" else "_" + datasetProperty
         try:
-            setattr(out, targetProperty, h5py.File(hdfFile, mode="r")[datasetProperty])
+            setattr(
+                out,
+                targetProperty,
+                h5py.File(
+                    hdfFile, mode="r", rdcc_nbytes=spy.__h5cache__, rdcc_nslots=spy.__h5slots__
+                )[datasetProperty],
+            )
         except KeyError:
             if datasetProperty == "data":
                 raise SPYError(
@@ -5,6 +5,7 @@
 # load_tdt.py Merge separate TDT SEV files into one HDF5 file
 
 import os
+import struct
 from datetime import datetime
 import re
 import numpy as np
@@ -13,7 +14,7 @@ import h5py
 
 # Local imports
 from syncopy.shared.parsers import io_parser, scalar_parser
-from syncopy.shared.errors import SPYWarning, SPYValueError
+from syncopy.shared.errors import SPYWarning, SPYValueError, SPYTypeError
 from syncopy.shared.tools import StructDict
 import syncopy as spy
 
@@ -21,7 +22,7 @@ import syncopy as spy
 # --- The user exposed function ---
 
 
-def load_tdt(data_path, start_code=None, end_code=None, subtract_median=False):
+def load_tdt(data_path, start_code=None, end_code=None, subtract_median=False, use_memmap=True):
     """
     Imports TDT time series data and meta-information
     into a single :class:`~syncopy.AnalogData` object.
@@ -52,6 +53,10 @@ def load_tdt(data_path, start_code=None, end_code=None, subtract_median=False):
     subtract_median : bool
         Set  to `True` to subtract the median from all
         individual time series
+    use_memmap : bool
+        If `True` (default), the `.sev` files are memory-mapped while
+        merging. Set to `False` to read them directly into memory instead,
+        which is usually faster for files which comfortably fit into RAM
 
     Returns
     -------
@@ -93,6 +98,9 @@ def load_tdt(data_path, start_code=None, end_code=None, subtract_median=False):
         scalar_parser(start_code, "start_code", ntype="int_like")
         scalar_parser(end_code, "end_code", ntype="int_like")
 
+    if not isinstance(use_memmap, bool):
+        raise SPYTypeError(use_memmap, varname="use_memmap", expected="bool")
+
     # initialize tdt info loader class
     TDT_Load_Info = ESI_TDTinfo(data_path)
     # this is a StructDict
@@ -101,7 +109,9 @@ def load_tdt(data_path, start_code=None, end_code=None, subtract_median=False):
     # nicely sorted by channel names
     file_paths = _get_source_paths(data_path, ".sev")
 
-    tdt_data_handler = ESI_TDTdata(data_path, subtract_median=subtract_median, channels=None)
+    tdt_data_handler = ESI_TDTdata(
+        data_path, subtract_median=subtract_median, channels=None, use_memmap=use_memmap
+    )
 
     adata = tdt_data_handler.data_aranging(file_paths, tdt_info)
     # we have to open for reading again
@@ -110,7 +120,8 @@ def load_tdt(data_path, start_code=None, end_code=None, subtract_median=False):
     # Write log-entry
     msg = f"loaded TDT data from {len(file_paths)} files\n"
     msg += f"\tsource folder: {data_path}\n"
-    msg += f"\tsubtract median: {subtract_median}"
+    msg += f"\tsubtract median: {subtract_median}\n"
+    msg += f"\tuse memmap: {use_memmap}"
     adata.log = msg
 
     if start_code is not None:
@@ -141,6 +152,8 @@ class ESI_TDTinfo:
         self.INVALID_MASK = int("FFFF0000", 16)
         self.STARTBLOCK = int("0001", 16)
         self.STOPBLOCK = int("0002", 16)
+        # block marker code, 4 padding bytes, time stamp
+        self.MARKER_FMT = "<i4xd"
         self.ALLOWED_FORMATS = [
             np.float32,
             np.int32,
@@ -223,24 +236,23 @@ class ESI_TDTinfo:
         if len(tsq_list) > 1:
             raise Exception("multiple TSQ files found\n{0}".format(", ".join(tsq_list)))
         tsq = open(tsq_list[0], "rb")
-        tsq.seek(0, os.SEEK_SET)
+        # block marker (int32) and time stamp (float64) are read
+        # with a single call from their 16 byte header record
         tsq.seek(48, os.SEEK_SET)
-        code1 = np.fromfile(tsq, dtype=np.int32, count=1)
+        code1, start_time = struct.unpack(self.MARKER_FMT, tsq.read(16))
         assert code1 == self.STARTBLOCK, "Block start marker not found"
-        tsq.seek(56, os.SEEK_SET)
-        header.start_time = np.fromfile(tsq, dtype=np.float64, count=1)
+        header.start_time = np.array([start_time])
 
         # read stop time
         tsq.seek(-32, os.SEEK_END)
-        code2 = np.fromfile(tsq, dtype=np.int32, count=1)
+        code2, stop_time = struct.unpack(self.MARKER_FMT, tsq.read(16))
         if code2 != self.STOPBLOCK:
             SPYWarning(
                 "Block end marker not found, block did not end cleanly. Try setting T2 smaller if errors occur"
             )
             header.stop_time = np.nan
         else:
-            tsq.seek(-24, os.SEEK_END)
-            header.stop_time = np.fromfile(tsq, dtype=np.float64, count=1)
+            header.stop_time = np.array([stop_time])
 
         [data.info.tankpath, data.info.blockname] = os.path.split(os.path.normpath(self.block_path))
         data.info.start_date = datetime.fromtimestamp(header.start_time[0])
@@ -701,17 +713,23 @@ class ESI_TDTinfo:
 
 
 class ESI_TDTdata:
+
+    HEADERSIZE = 40
+    DTYPE = "single"
+
     def __init__(
         self,
         inputdir,
         subtract_median=False,
         channels=None,
+        use_memmap=True,
     ):
 
         self.inputdir = inputdir
         self.chan_in_chunks = 16
         self.subtract_median = subtract_median
         self.channels = "all" if channels is None else channels
+        self.use_memmap = use_memmap
 
     def arrange_header(self, DataInfo_loaded, Files):
         header = StructDict()
@@ -719,14 +737,28 @@ class ESI_TDTdata:
         header["total_num_channel"] = len(Files)
         return header
 
-    def read_data(self, filename):
-        HEADERSIZE = 40
-        """Read data from a TDT SEV file created by the RS4 streamer"""
+    def read_data(self, filename, count=None):
+        """
+        Read data from a TDT SEV file created by the RS4 streamer
+
+        If `use_memmap` is set, the memmap is constructed on demand and gets
+        released as soon as the (at most `count`) samples have been copied by
+        the caller. Otherwise the samples are read directly into memory.
+        """
+        nSamples = self.data_length(filename)
+        if count is not None:
+            nSamples = min(count, nSamples)
+        if self.use_memmap:
+            return np.memmap(filename, dtype=self.DTYPE, mode="r", offset=self.HEADERSIZE, shape=(nSamples,))
         with open(filename, "rb") as f:
-            f.seek(HEADERSIZE)
-            data = np.fromfile(f, dtype="single")
+            f.seek(self.HEADERSIZE)
+            data = np.fromfile(f, dtype=self.DTYPE, count=nSamples)
         return data
 
+    def data_length(self, filename):
+        """Number of samples in a TDT SEV file, without reading it"""
+        return (os.path.getsize(filename) - self.HEADERSIZE) // np.dtype(self.DTYPE).itemsize
+
     def md5sum(self, filename):
         from hashlib import md5
 
@@ -739,9 +771,8 @@ class ESI_TDTdata:
     def data_aranging(self, Files, DataInfo_loaded):
         AData = spy.AnalogData(dimord=["time", "channel"])
         hdf_out_path = AData.filename
-        LenOfData = self.read_data(Files[0]).shape[
-            0
-        ]  # Lenght of the data is always set to the length of the first channel
+        # Lenght of the data is always set to the length of the first channel
+        LenOfData = self.data_length(Files[0])
         with h5py.File(hdf_out_path, "w") as combined_data_file:
             idxStartStop = [
                 np.clip(
@@ -757,7 +788,7 @@ class ESI_TDTdata:
                 )
             )
             for (start, stop) in tqdm(iterable=idxStartStop, desc="chunk", unit="chunk", disable=None):
-                data = [self.read_data(Files[jj])[:LenOfData] for jj in range(start, stop)]
+                data = [self.read_data(Files[jj], count=LenOfData) for jj in range(start, stop)]
                 data = np.vstack(data).T
                 if start == 0:
                     # this is the actual dataset for the AnalogData
@@ -8,6 +8,8 @@ import os
 import sys
 import shutil
 import inspect
+import hashlib
+import mmap
 import numpy as np
 from datetime import datetime
 from glob import glob
@@ -26,7 +28,7 @@ from syncopy import __storage__, __sessionid__, __checksum_algorithm__, __spydir
 from syncopy.datatype.base_data import BaseData
 from syncopy.datatype.util import get_dir_size
 from syncopy.shared.parsers import scalar_parser
-from syncopy.shared.errors import SPYTypeError, log
+from syncopy.shared.errors import SPYError, SPYTypeError, log
 from syncopy.shared.queries import user_input
 
 __all__ = ["cleanup", "clear"]
@@ -46,17 +48,41 @@ startInfoDict["order"] = "C"
 startInfoDict["checksum_algorithm"] = __checksum_algorithm__.__name__
 
 
-def hash_file(fname, bsize=65536):
+def hash_file(fname, algorithm=None):
     """
-    An enlightening docstring...
+    Compute the checksum of the file `fname`
 
-    Internal helper routine, do not parse inputs
+    Internal helper routine, do not parse inputs. `algorithm` is the name
+    of the checksum algorithm as stored in Syncopy's info files, if `None`
+    ``syncopy.__checksum_algorithm__`` is used.
     """
 
-    hash = __checksum_algorithm__()
+    if algorithm is None:
+        algorithm = __checksum_algorithm__.__name__
+
+    # BLAKE3 hashes the memory-mapped file multi-threaded,
+    # no user-space reads required
+    if algorithm == "blake3":
+        try:
+            from blake3 import blake3
+        except ImportError:
+            raise SPYError(
+                "Checksum algorithm 'blake3' is not available. Please install the 'blake3' package "
+                + "or skip checksum verification."
+            )
+
+        hash = blake3(max_threads=blake3.AUTO)
+        hash.update_mmap(fname)
+        return hash.hexdigest()
+
+    # hashlib constructors are named, e.g., 'openssl_sha1'
+    hash = hashlib.new(algorithm.replace("openssl_", ""))
+    # hash the memory-mapped file in one go (empty files can't be mapped),
+    # hashlib reads the mapped pages directly and releases the GIL
     with open(fname, "rb") as f:
-        for block in iter(lambda: f.read(bsize), b""):
-            hash.update(block)
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                hash.update(mm)
     return hash.hexdigest()
 
 
@@ -534,7 +534,7 @@ class Downsample(ComputationalRoutine):
         out.trialdefinition = trl
         # now set new samplerate
         out.samplerate = self.cfg["new_samplerate"]
-        out.channel = np.array(data.channel[chanSec])
+        out.channel = data.channel[chanSec]
 
 
 @process_io
@@ -651,7 +651,7 @@ class Resample(ComputationalRoutine):
 
         # now set new samplerate
         out.samplerate = self.cfg["new_samplerate"]
-        out.channel = np.array(data.channel[chanSec])
+        out.channel = data.channel[chanSec]
 
 
 @process_io
@@ -970,12 +970,20 @@ class ComputationalRoutine(ABC):
         compute : management routine invoking parallel/sequential compute kernels
         compute_parallel : concurrent processing counterpart of this method
         """
-        sourceObj = h5py.File(data.filename, mode="r")[data.data.name]
-
-        # Iterate over (selected) trials and write directly to target HDF5 dataset
-        with h5py.File(out.filename, "r+") as h5fout:
+        # Open source and target only once for the whole trial loop, the
+        # context manager also closes the source in case of errors
+        with h5py.File(
+            data.filename, mode="r", rdcc_nbytes=spy.__h5cache__, rdcc_nslots=spy.__h5slots__
+        ) as h5fin, h5py.File(out.filename, "r+") as h5fout:
+            sourceObj = h5fin[data.data.name]
             target = h5fout[self.outDatasetName]
 
+            # Trial-averages are summed up in memory and written only once
+            # instead of re-reading and re-writing `target` for every trial
+            if not self.keeptrials:
+                trialSum = np.zeros(target.shape, dtype=target.dtype)
+
+            # Iterate over (selected) trials and write directly to target HDF5 dataset
             for nblock in tqdm(range(self.numTrials), bar_format=self.tqdmFormat, disable=None):
 
                 # Extract respective indexing tuples from constructed lists
@@ -996,10 +1004,9 @@ class ComputationalRoutine(ABC):
                 else:
                     # Get source data as NumPy array
                     if self.useFancyIdx:
-                        arr = np.array(sourceObj[tuple(ingrid)])[np.ix_(*sigrid)]
+                        arr = np.asarray(sourceObj[tuple(ingrid)])[np.ix_(*sigrid)]
                     else:
-                        arr = np.array(sourceObj[tuple(ingrid)])
-                    sourceObj.flush()
+                        arr = np.asarray(sourceObj[tuple(ingrid)])
 
                     # Ensure input array shape was not inflated by scalar selection
                     # tuple, e.g., ``e=np.ones((2,2)); e[0,:].shape = (2,)`` not ``(1,2)``
@@ -1022,17 +1029,15 @@ class ComputationalRoutine(ABC):
                 if self.keeptrials:
                     target[outgrid] = res
                 else:
-                    target[()] += res
+                    trialSum += res
 
                 # Flush every iteration to avoid memory leakage
                 h5fout.flush()
 
             # If trial-averaging was requested, normalize computed sum to get mean
             if not self.keeptrials:
-                target[()] /= self.numTrials
-
-        # If source was HDF5 file, close it to prevent access errors
-        sourceObj.file.close()
+                trialSum /= self.numTrials
+                target[()] = trialSum
 
     def write_log(self, data, out, log_dict=None):
         """
@@ -1185,15 +1190,15 @@ def propagate_properties(in_data, out_data, keeptrials=True, time_axis=False):
 
     elif is_Spectral(out_data):
         chanSec = in_data.selection.channel
-        out_data.channel = np.array(in_data.channel[chanSec])
+        out_data.channel = in_data.channel[chanSec]
 
     # from one channel to cross-channel data
     elif (is_Analog(in_data) or is_Spectral(in_data)) and is_CrossSpectral(out_data):
         chanSec = in_data.selection.channel
         nChan = len(in_data.channel)
         if out_data.data.shape[-2:] == (nChan, nChan):
-            out_data.channel_i = np.array(in_data.channel[chanSec])
-            out_data.channel_j = np.array(in_data.channel[chanSec])
+            out_data.channel_i = in_data.channel[chanSec]
+            out_data.channel_j = in_data.channel[chanSec]
 
         # else `channelcmb` got used and channel labels
         # get attached within the respective CR
@@ -21,16 +21,24 @@ spectralDTypes = {
     "complex": np.complex64,
 }
 
+
+def _power(x):
+    """Squared magnitude without a complex-valued `x * conj(x)` temporary"""
+    pw = np.square(x.real)
+    pw += np.square(x.imag)
+    return pw.astype(spectralDTypes["pow"], copy=False)
+
+
 #: output conversion of complex fourier coefficients
 spectralConversions = {
-    "pow": lambda x: (x * np.conj(x)).real.astype(spectralDTypes["pow"]),
-    "abs": lambda x: (np.absolute(x)).real.astype(spectralDTypes["abs"]),
-    "fourier": lambda x: x.astype(spectralDTypes["fourier"]),
+    "pow": _power,
+    "abs": lambda x: np.absolute(x).astype(spectralDTypes["abs"], copy=False),
+    "fourier": lambda x: x.astype(spectralDTypes["fourier"], copy=False),
     "real": lambda x: np.real(x).astype(spectralDTypes["real"]),
     "imag": lambda x: np.imag(x).astype(spectralDTypes["imag"]),
-    "angle": lambda x: np.angle(x).astype(spectralDTypes["angle"]),
-    "absreal": lambda x: np.abs(np.real(x)).astype(spectralDTypes["absreal"]),
-    "absimag": lambda x: np.abs(np.imag(x)).astype(spectralDTypes["absimag"]),
+    "angle": lambda x: np.angle(x).astype(spectralDTypes["angle"], copy=False),
+    "absreal": lambda x: np.abs(np.real(x)).astype(spectralDTypes["absreal"], copy=False),
+    "absimag": lambda x: np.abs(np.imag(x)).astype(spectralDTypes["absimag"], copy=False),
 }
 
 # FT compat
@@ -44,7 +52,7 @@ all_windows.remove("exponential")  # not symmetric
 all_windows.remove("dpss")  # activated via `tapsmofrq`
 
 availableTapers = all_windows
-availablePaddingOpt = ["maxperlen", "nextpow2"]
+availablePaddingOpt = ["maxperlen", "nextpow2", "nextfastlen"]
 
 #: general, method agnostic, parameters for our CRs
 generalParameters = (
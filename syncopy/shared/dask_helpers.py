@@ -3,29 +3,35 @@
 # Basic checkers to facilitate direct Dask interface
 #
 
+import functools
+import shutil
 import subprocess
-from time import sleep
+from dask.distributed import get_worker
 
 # Syncopy imports
 from syncopy.shared.errors import SPYWarning, SPYInfo
 from .log import get_logger
 
 
+@functools.lru_cache(maxsize=1)
 def check_slurm_available():
     """
     Returns `True` if a SLURM instance could be reached via
     a `sinfo` call, `False` otherwise.
+
+    The result is cached for the lifetime of the interpreter, use
+    `check_slurm_available.cache_clear()` to force a new probe.
     """
 
-    # Check if SLURM's `sinfo` can be accessed
-    proc = subprocess.Popen("sinfo", stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=True)
-    _, err = proc.communicate()
+    # No `sinfo` on the PATH, no need to spawn anything
+    if shutil.which("sinfo") is None:
+        return False
+
+    # Check if SLURM's `sinfo` can actually reach a controller
+    proc = subprocess.run(["sinfo"], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
     # Any non-zero return-code means SLURM is not available
     # so we disable ACME
-    if proc.returncode != 0:
-        has_slurm = False
-    else:
-        has_slurm = True
+    has_slurm = proc.returncode == 0
 
     return has_slurm
 
@@ -39,22 +45,29 @@ def check_workers_available(client, n_workers=1, timeout=120):
     logger = get_logger()
     totalWorkers = len(client.cluster.requested)
 
-    # dictionary of workers
-    workers = client.cluster.scheduler_info["workers"]
-
-    # some small initial wait
-    sleep(0.25)
-
-    if len(workers) < n_workers:
+    # query the scheduler directly, the cluster's cached
+    # worker dictionary lags behind during start up; `scheduler_info`
+    # only lists a truncated set of workers
+    if len(client.nthreads()) < n_workers:
         logger.important(
             f"waiting for at least {n_workers}/{totalWorkers} workers being available, timeout after {timeout} seconds.."
         )
     client.wait_for_workers(n_workers, timeout=timeout)
 
-    sleep(0.25)
-
     # report what we have
-    logger.important(f"{len(workers)}/{totalWorkers} workers available, starting computation..")
+    nWorkers = len(client.nthreads())
+    logger.important(f"{nWorkers}/{totalWorkers} workers available, starting computation..")
+
+
+def fft_workers():
+    """
+    Number of threads to use for (multi-channel) FFTs: all cores
+    for sequential computations, only a single one inside
+    Dask workers which already run in parallel
+    """
 
-    # wait a little more to get consistent client print out
-    sleep(0.25)
+    try:
+        get_worker()
+    except ValueError:
+        return -1
+    return 1
@@ -12,6 +12,7 @@ import numpy as np
 import numbers
 from inspect import signature
 from scipy.signal import windows
+from scipy.fft import next_fast_len
 
 from syncopy.specest.mtmfft import _get_dpss_pars
 from syncopy.shared.errors import SPYValueError, SPYWarning, SPYInfo
@@ -36,13 +37,14 @@ def process_padding(pad, lenTrials, samplerate):
 
     Parameters
     ----------
-    pad : 'maxperlen', float or 'nextpow2'
+    pad : 'maxperlen', float, 'nextpow2' or 'nextfastlen'
         For the frontend default `maxperlen`, no padding is to
         be performed in case of equal length trials but unequal lengths
         trials get padded to the max. trial length.
         A float indicates the absolute length of
         all trials after padding in seconds. `'nextpow2'` pads all trials
-        to the nearest power of two.
+        to the nearest power of two. `'nextfastlen'` pads all trials to
+        the nearest length the FFT can process efficiently.
     lenTrials : sequence of int_like
         Sequence holding all individual trial lengths
     samplerate : float
@@ -64,7 +66,7 @@ def process_padding(pad, lenTrials, samplerate):
     if isinstance(pad, bool):
         not_valid = True
     if not_valid:
-        lgl = "'maxperlen', 'nextpow2' or a float number"
+        lgl = "'maxperlen', 'nextpow2', 'nextfastlen' or a float number"
         actual = f"{pad}"
         raise SPYValueError(legal=lgl, varname="pad", actual=actual)
 
@@ -78,6 +80,10 @@ def process_padding(pad, lenTrials, samplerate):
     elif pad == "nextpow2":
         abs_pad = _nextpow2(int(lenTrials.max()))
 
+    # pad to the smallest 5-smooth length, usually much shorter than `nextpow2`
+    elif pad == "nextfastlen":
+        abs_pad = next_fast_len(int(lenTrials.max()), real=True)
+
     # no padding in case of equal length trials
     elif pad == "maxperlen":
         abs_pad = int(lenTrials.max())
@@ -430,7 +436,5 @@ def check_passed_kwargs(lcls, defaults, frontend_name):
 
 def _nextpow2(number):
     """Find integer power of 2 greater than or equal to number."""
-    n = 1
-    while n < number:
-        n *= 2
-    return n
+    number = int(number)
+    return 1 << (number - 1).bit_length() if number > 1 else 1
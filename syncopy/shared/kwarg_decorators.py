@@ -681,11 +681,13 @@ def process_io(func):
         if any([not sel for sel in ingrid]):
             res, details = np.empty(outshape, dtype=outdtype), {}
         else:
-            with h5py.File(infilename, mode="r") as h5fin:
+            with h5py.File(
+                infilename, mode="r", rdcc_nbytes=spy.__h5cache__, rdcc_nslots=spy.__h5slots__
+            ) as h5fin:
                 if fancy:
-                    arr = np.array(h5fin[indset][ingrid])[np.ix_(*sigrid)]
+                    arr = np.asarray(h5fin[indset][ingrid])[np.ix_(*sigrid)]
                 else:
-                    arr = np.array(h5fin[indset][ingrid])
+                    arr = np.asarray(h5fin[indset][ingrid])
 
             # === STEP 2 === perform computation
             # Ensure input array shape was not inflated by scalar selection
@@ -1,6 +1,7 @@
 #  Function for handling additional return values from compute functions
 
 import h5py
+from contextlib import nullcontext
 from hmac import compare_digest
 from numbers import Number
 import numpy as np
@@ -19,8 +20,10 @@ def metadata_from_hdf5_file(h5py_filename, delete_afterwards=True):
 
     Parameters
     ----------
-    h5py_filename str
+    h5py_filename str or h5py.File
         path to hdf5 file. The file will be opened for reading, and closed in the end.
+        Alternatively an already open file, which is used as is and left open
+        (it has to be writable if `delete_afterwards` is `True`).
         The file must contain a standard or virtual dataset named 'data'.
         If it does not contain 'metadata' group, the returned value will be `None`.
     delete_afterwards bool
@@ -34,15 +37,21 @@ def metadata_from_hdf5_file(h5py_filename, delete_afterwards=True):
     """
     metadata = None
     open_mode = "a" if delete_afterwards else "r"
-    with h5py.File(h5py_filename, mode=open_mode) as h5f:
+    if isinstance(h5py_filename, h5py.File):
+        h5file = nullcontext(h5py_filename)
+    else:
+        h5file = h5py.File(h5py_filename, mode=open_mode)
+    with h5file as h5f:
         if "data" in h5f:
             main_dset = h5f["data"]
             if main_dset.is_virtual:
                 metadata_list = list()  # A list of dicts.
 
-                # Now open the virtual sources and check there for the metadata.
-                for source_tpl in main_dset.virtual_sources():
-                    with h5py.File(source_tpl.file_name, mode=open_mode) as h5f_virtual_part:
+                # Now open the virtual sources and check there for the metadata,
+                # each source file only once (a file may back several parts).
+                source_files = dict.fromkeys(src.file_name for src in main_dset.virtual_sources())
+                for source_file in source_files:
+                    with h5py.File(source_file, mode=open_mode) as h5f_virtual_part:
                         if "metadata" in h5f_virtual_part:
                             virtual_metadata_grp = h5f_virtual_part["metadata"]
                             metadata_list.append(extract_md_group(virtual_metadata_grp))
@@ -57,7 +66,7 @@ def metadata_from_hdf5_file(h5py_filename, delete_afterwards=True):
                         del h5f["metadata"]
         else:
             raise SPYValueError(
-                "'data' dataset in hd5f file {of}.".format(of=h5py_filename),
+                "'data' dataset in hd5f file {of}.".format(of=h5f.filename),
                 actual="no such dataset",
             )
     return metadata
@@ -83,7 +92,7 @@ def _merge_md_list(md_list):
     metadata = dict()
     for md in md_list:
         # We just join all of them into a single dict, the unique keys allow this.
-        metadata = {**metadata, **md}
+        metadata.update(md)
     return metadata
 
 
@@ -260,10 +269,9 @@ def extract_md_group(md):
     -------
     dict, containing entries of type `(str, np.ndarray)`.
     """
-    metadata = dict()
-    for k, v in md.attrs.items():
-        metadata[k] = v.copy()  # copy the numpy array
-    return metadata
+    # reading attributes already yields arrays that are
+    # independent of the file, no need to copy them again
+    return dict(md.attrs.items())
 
 
 def cast_0array(rule, arr):
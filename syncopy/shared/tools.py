@@ -314,7 +314,14 @@ def best_match(source, selection, span=False, tol=None, squash_duplicates=False)
 
     # Interval-selections are a lot easier than discrete time-points...
     if span:
-        idx = np.intersect1d(np.where(source >= selection[0])[0], np.where(source <= selection[1])[0])
+        # time/frequency axes are sorted: bisect for the interval bounds
+        if np.all(source[1:] >= source[:-1]):
+            idx = np.arange(
+                np.searchsorted(source, selection[0], side="left"),
+                np.searchsorted(source, selection[1], side="right"),
+            )
+        else:
+            idx = np.intersect1d(np.where(source >= selection[0])[0], np.where(source <= selection[1])[0])
     else:
         issorted = True
         if source.size > 1 and np.diff(source).min() < 0:
@@ -343,6 +350,45 @@ def best_match(source, selection, span=False, tol=None, squash_duplicates=False)
         return source[idx], idx
 
 
+def detrend(dat, order=0, axis=0):
+    """
+    Remove the mean (`order` = 0) or a linear trend (`order` = 1)
+    from uniformly sampled data along `axis`
+
+    Equivalent to :func:`scipy.signal.detrend` with `type` 'constant'
+    or 'linear', but the least squares fit on a uniform grid is
+    computed in closed form instead of solving a regression problem.
+
+    Parameters
+    ----------
+    dat : NumPy array
+        Data to detrend, integer data is promoted to `float64`
+    order : int
+        Polynomial order of the trend to remove, either 0 or 1
+    axis : int
+        Axis along which to detrend
+
+    Returns
+    -------
+    res : NumPy array
+        Detrended copy of `dat`
+    """
+
+    dat = np.moveaxis(np.asarray(dat), axis, 0)
+    if not np.issubdtype(dat.dtype, np.inexact):
+        dat = dat.astype(np.float64)
+
+    res = dat - dat.mean(axis=0)
+    nSamples = res.shape[0]
+    if order == 1 and nSamples > 1:
+        # centered time grid, orthogonal to the constant term
+        grid = np.arange(nSamples, dtype=res.real.dtype) - (nSamples - 1) / 2
+        slope = np.tensordot(grid, res, axes=(0, 0)) / (grid @ grid)
+        res -= grid.reshape((-1,) + (1,) * (res.ndim - 1)) * slope
+
+    return np.moveaxis(res, 0, axis)
+
+
 def get_defaults(obj):
     """
     Parse input arguments of `obj` and return dictionary
@@ -3,7 +3,9 @@
 # Helper routines to normalize Fourier spectra
 #
 
+import functools
 import numpy as np
+from scipy import signal
 
 
 def _norm_spec(ftr, nSamples, fs, mode="bins"):
@@ -44,3 +46,33 @@ def _norm_taper(taper, windows, nSamples):
         windows *= np.sqrt(4 / 3) * np.sqrt(nSamples / windows.sum())
 
     return windows
+
+
+def _get_tapers(taper, nSamples, nNorm, taper_opt):
+
+    """
+    Normalized (multi-)taper windows of length `nSamples`, see
+    :func:`_norm_taper` for the normalization with `nNorm`.
+
+    All trials of an analysis use the same tapers and computing
+    Slepian sequences is costly, hence the windows get cached.
+    The returned array is read-only!
+    """
+
+    try:
+        return _get_tapers_cached(taper, nSamples, nNorm, tuple(sorted(taper_opt.items())))
+    # unhashable taper options, e.g. lists of coefficients
+    except TypeError:
+        taper_func = getattr(signal.windows, taper)
+        windows = np.atleast_2d(taper_func(nSamples, **taper_opt))
+        return _norm_taper(taper, windows, nNorm)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_tapers_cached(taper, nSamples, nNorm, taper_opt):
+
+    taper_func = getattr(signal.windows, taper)
+    windows = np.atleast_2d(taper_func(nSamples, **dict(taper_opt)))
+    windows = _norm_taper(taper, windows, nNorm)
+    windows.flags.writeable = False
+    return windows
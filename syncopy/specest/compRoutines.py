@@ -23,8 +23,6 @@ from inspect import signature
 import numpy as np
 from hashlib import blake2b
 
-from scipy import signal
-
 # backend method imports
 from .mtmfft import mtmfft
 from .mtmconvol import mtmconvol
@@ -35,7 +33,7 @@ from .fooofspy import fooofspy
 
 # Local imports
 from syncopy.shared.errors import SPYValueError, SPYWarning, SPYParallelLog
-from syncopy.shared.tools import best_match
+from syncopy.shared.tools import best_match, detrend
 from syncopy.shared.computational_routine import (
     ComputationalRoutine,
     propagate_properties,
@@ -166,16 +164,14 @@ def mtmfft_cF(
         return outShape, spectralDTypes[output]
 
     # detrend, does not work with 'FauxTrial' data..
-    if polyremoval == 0:
-        dat = signal.detrend(dat, type="constant", axis=0, overwrite_data=True)
-    elif polyremoval == 1:
-        dat = signal.detrend(dat, type="linear", axis=0, overwrite_data=True)
+    if polyremoval is not None:
+        dat = detrend(dat, order=polyremoval, axis=0)
 
     # call actual specest method
     res, freqs = mtmfft(dat, **method_kwargs)
 
     # attach time-axis and convert to output
-    spec = res[np.newaxis, :, freq_idx, :]
+    spec = res[np.newaxis, :, _idx_to_slice(freq_idx), :]
     spec = spectralConversions[output](spec)
 
     # Hash the freqs and add to second return value.
@@ -215,7 +211,7 @@ class MultiTaperFFT(ComputationalRoutine):
     def process_metadata(self, data, out):
 
         # General-purpose loading of metadata.
-        metadata = metadata_from_hdf5_file(out.filename)
+        metadata = metadata_from_hdf5_file(out.data.file)
 
         check_freq_hashes(metadata, out)
 
@@ -386,7 +382,7 @@ def mtmconvol_cF(
     if equidistant:
         ftr, freqs = mtmconvol(dat[soi, :], **method_kwargs)
         _, fIdx = best_match(freqs, foi, squash_duplicates=True)
-        spec = ftr[postselect, :, fIdx, :]
+        spec = ftr[postselect, :, _idx_to_slice(fIdx), :]
         spec = spectralConversions[output](spec)
 
     else:
@@ -396,21 +392,33 @@ def mtmconvol_cF(
         taper = method_kwargs["taper"]
 
         # In case tapers aren't preserved allocate `spec` "too big"
-        # and average afterwards
-        spec = np.full((nTime, nTaper, nFreq, nChannels), np.nan, dtype=spectralDTypes[output])
-
-        ftr, freqs = mtmfft(dat[soi[0], :], samplerate, taper=taper, taper_opt=taper_opt)
-        _, fIdx = best_match(freqs, foi, squash_duplicates=True)
-        spec[0, ...] = spectralConversions[output](ftr[:, fIdx, :])
-        # loop over remaining soi to center windows on
-        for tk in range(1, len(soi)):
-            ftr, freqs = mtmfft(dat[soi[tk], :], samplerate, taper=taper, taper_opt=taper_opt)
-            spec[tk, ...] = spectralConversions[output](ftr[:, fIdx, :])
+        # and average afterwards, every window gets written below
+        # so there is no need to initialize the buffer
+        spec = np.empty((nTime, nTaper, nFreq, nChannels), dtype=spectralDTypes[output])
+
+        segments = [dat[sl, :] for sl in soi]
+        if all(seg.shape[0] == segments[0].shape[0] for seg in segments):
+            # windows of identical length: stack them along the channel axis
+            # as (nSamples x nTime * nChannels) and transform all in one go
+            ftr, freqs = mtmfft(np.hstack(segments), samplerate, taper=taper, taper_opt=taper_opt)
+            _, fIdx = best_match(freqs, foi, squash_duplicates=True)
+            ftr = ftr[:, _idx_to_slice(fIdx), :].reshape(ftr.shape[0], -1, nTime, nChannels)
+            spec[...] = spectralConversions[output](ftr.transpose(2, 0, 1, 3))
+        else:
+            ftr, freqs = mtmfft(segments[0], samplerate, taper=taper, taper_opt=taper_opt)
+            _, fIdx = best_match(freqs, foi, squash_duplicates=True)
+            fIdx = _idx_to_slice(fIdx)
+            spec[0, ...] = spectralConversions[output](ftr[:, fIdx, :])
+            # loop over remaining soi to center windows on
+            for tk in range(1, len(soi)):
+                ftr, freqs = mtmfft(segments[tk], samplerate, taper=taper, taper_opt=taper_opt)
+                spec[tk, ...] = spectralConversions[output](ftr[:, fIdx, :])
 
     # Average across tapers if wanted
     # only valid if output='pow' !
+    # `spec` is completely filled, so no NaN-aware average is needed
     if not keeptapers:
-        return np.nanmean(spec, axis=1, keepdims=True)
+        return spec.mean(axis=1, keepdims=True)
     return spec
 
 
@@ -458,7 +466,7 @@ class MultiTaperFFTConvol(ComputationalRoutine):
         # Attach meta-data
         out.trialdefinition = trl
         out.samplerate = srate
-        out.channel = np.array(data.channel[chanSec])
+        out.channel = data.channel[chanSec]
 
         taper_kw = self.cfg["method_kwargs"]["taper"]
         if taper_kw is None:
@@ -579,20 +587,24 @@ def wavelet_cF(
         return outShape, spectralDTypes[output]
 
     # detrend, does not work with 'FauxTrial' data..
-    if polyremoval == 0:
-        dat = signal.detrend(dat, type="constant", axis=0, overwrite_data=True)
-    elif polyremoval == 1:
-        dat = signal.detrend(dat, type="linear", axis=0, overwrite_data=True)
+    if polyremoval is not None:
+        dat = detrend(dat, order=polyremoval, axis=0)
 
     # ------------------
     # actual method call
     # ------------------
     # Compute wavelet transform with given data/time-selection
     spec = wavelet(dat[preselect, :], **method_kwargs)
-    # the cwt stacks the scales on the 1st axis, move to 2nd
-    spec = spec.transpose(1, 0, 2)[postselect, :, :]
+    # convert only the selected time points, still in the
+    # (nScales x nTime x nChannels) layout of the cwt
+    spec = spectralConversions[output](spec[:, _idx_to_slice(postselect), :])
 
-    return spectralConversions[output](spec[:, np.newaxis, :, :])
+    # the cwt stacks the scales on the 1st axis, move to 3rd
+    # with a single copy into a contiguous output array
+    out = np.empty((spec.shape[1], 1, spec.shape[0], spec.shape[2]), dtype=spec.dtype)
+    out[:, 0, ...] = spec.transpose(1, 0, 2)
+
+    return out
 
 
 class WaveletTransform(ComputationalRoutine):
@@ -639,7 +651,7 @@ class WaveletTransform(ComputationalRoutine):
         # Attach meta-data
         out.trialdefinition = trl
         out.samplerate = srate
-        out.channel = np.array(data.channel[chanSec])
+        out.channel = data.channel[chanSec]
         out.freq = 1 / self.cfg["method_kwargs"]["wavelet"].fourier_period(
             self.cfg["method_kwargs"]["scales"]
         )
@@ -747,17 +759,15 @@ def superlet_cF(
         return outShape, spectralDTypes[output]
 
     # detrend, does not work with 'FauxTrial' data..
-    if polyremoval == 0:
-        dat = signal.detrend(dat, type="constant", axis=0, overwrite_data=True)
-    elif polyremoval == 1:
-        dat = signal.detrend(dat, type="linear", axis=0, overwrite_data=True)
+    if polyremoval is not None:
+        dat = detrend(dat, order=polyremoval, axis=0)
 
     # ------------------
     # actual method call
     # ------------------
     gmean_spec = superlet(dat[preselect, :], **method_kwargs)
     # the cwtSL stacks the scales on the 1st axis
-    gmean_spec = gmean_spec.transpose(1, 0, 2)[postselect, :, :]
+    gmean_spec = gmean_spec.transpose(1, 0, 2)[_idx_to_slice(postselect), :, :]
 
     return spectralConversions[output](gmean_spec[:, np.newaxis, :, :])
 
@@ -804,12 +814,30 @@ class SuperletTransform(ComputationalRoutine):
         # Attach meta-data
         out.trialdefinition = trl
         out.samplerate = srate
-        out.channel = np.array(data.channel[chanSec])
+        out.channel = data.channel[chanSec]
         # for the SL Morlets the conversion is straightforward
         out.freq = 1 / (2 * np.pi * self.cfg["method_kwargs"]["scales"])
         out.taper = np.array(["None"])
 
 
+def _idx_to_slice(idx):
+    """
+    Local helper to turn equally spaced, increasing indices into a `slice`,
+    such that the selection yields a view instead of a fancy-indexing copy.
+    Slices and irregular indices are returned as is.
+    """
+
+    if isinstance(idx, slice):
+        return idx
+    idx = np.asarray(idx)
+    if idx.ndim != 1 or idx.size == 0:
+        return idx
+    step = idx[1] - idx[0] if idx.size > 1 else 1
+    if step > 0 and np.all(np.diff(idx) == step):
+        return slice(int(idx[0]), int(idx[-1]) + 1, int(step))
+    return idx
+
+
 def _make_trialdef(cfg, trialdefinition, samplerate):
     """
     Local helper to construct trialdefinition arrays for time-frequency
@@ -855,14 +883,13 @@ def _make_trialdef(cfg, trialdefinition, samplerate):
     if isinstance(toi, np.ndarray):
 
         # Some index gymnastics to get trial begin/end samples
-        nToi = toi.size
-        time = np.cumsum([nToi] * trialdefinition.shape[0])
-        trialdefinition[:, 0] = time - nToi
-        trialdefinition[:, 1] = time
+        edges = toi.size * np.arange(trialdefinition.shape[0] + 1)
+        trialdefinition[:, 0] = edges[:-1]
+        trialdefinition[:, 1] = edges[1:]
 
         # Important: differentiate b/w equidistant time ranges and disjoint points
         tSteps = np.diff(toi)
-        if np.allclose(tSteps, [tSteps[0]] * tSteps.size):
+        if np.allclose(tSteps, tSteps[0]):
             samplerate = 1 / (toi[1] - toi[0])
         else:
             msg = (
@@ -871,7 +898,6 @@ def _make_trialdef(cfg, trialdefinition, samplerate):
             )
             SPYWarning(msg, caller="freqanalysis")
             samplerate = 1.0
-            trialdefinition[:, 2] = 0
 
         # Reconstruct trigger-onset based on provided time-point array
         trialdefinition[:, 2] = toi[0] * samplerate
@@ -881,17 +907,18 @@ def _make_trialdef(cfg, trialdefinition, samplerate):
     elif np.issubdtype(type(toi), np.number):
         mKw = cfg["method_kwargs"]
         winSize = mKw["nperseg"] - mKw["noverlap"]
-        trialdefinitionLens = np.ceil(np.diff(trialdefinition[:, :2]) / winSize)
-        sumLens = np.cumsum(trialdefinitionLens).reshape(trialdefinitionLens.shape)
-        trialdefinition[:, 0] = np.ravel(sumLens - trialdefinitionLens)
-        trialdefinition[:, 1] = sumLens.ravel()
+        # number of windows per trial via ceil-division of the (integer) trial lengths
+        nWindows = (trialdefinition[:, 1] - trialdefinition[:, 0] + winSize - 1) // winSize
+        bounds = np.cumsum(nWindows)
+        trialdefinition[:, 0] = bounds - nWindows
+        trialdefinition[:, 1] = bounds
         trialdefinition[:, 2] = trialdefinition[:, 2] / winSize
         samplerate = np.round(samplerate / winSize, 2)
 
     # If `toi` was "all", do **not** simply use provided `trialdefinition`: overlapping
     # trials require thie below `cumsum` gymnastics
     else:
-        bounds = np.cumsum(np.diff(trialdefinition[:, :2]))
+        bounds = np.cumsum(trialdefinition[:, 1] - trialdefinition[:, 0])
         trialdefinition[1:, 0] = bounds[:-1]
         trialdefinition[:, 1] = bounds
 
@@ -1038,7 +1065,7 @@ class FooofSpy(ComputationalRoutine):
         )
 
         # General-purpose loading of metadata.
-        mdata = metadata_from_hdf5_file(out.filename)
+        mdata = metadata_from_hdf5_file(out.data.file)
 
         # Note that FOOOF never sees absolute trial indices if a selection was
         # made in the call to `freqanalysis`, because the mtmfft run before will have
@@ -1066,7 +1093,7 @@ class FooofSpy(ComputationalRoutine):
 
         # Attach remaining meta-data
         out.samplerate = data.samplerate
-        out.channel = np.array(data.channel[chanSec])
+        out.channel = data.channel[chanSec]
         out.freq = data.freq
         out._trialdefinition = data._trialdefinition
 
@@ -1107,27 +1134,24 @@ class FooofSpy(ComputationalRoutine):
         function `metadata_from_hdf5_file()`.
         """
         for unique_attr_label, v in metadata_fooof_hdf5.items():
-            label, trial_idx, call_idx = decode_unique_md_label(unique_attr_label)
-            if label == "n_peaks":
-                n_peaks = v
-                SPYParallelLog(
-                    f"FOOOF detected {n_peaks} peaks in data of trial {trial_idx} call {call_idx}.",
-                    loglevel="DEBUG",
-                )
-                gaussian_params_out = list()
-                peak_params_out = list()
-                start_idx = 0
-                unique_attr_label_gaussian_params = encode_unique_md_label(
-                    "gaussian_params", trial_idx, call_idx
-                )
-                unique_attr_label_peak_params = encode_unique_md_label("peak_params", trial_idx, call_idx)
-                gaussian_params_in = metadata_fooof_hdf5[unique_attr_label_gaussian_params]
-                peak_params_in = metadata_fooof_hdf5[unique_attr_label_peak_params]
-                for trial_idx in range(len(n_peaks)):
-                    end_idx = start_idx + n_peaks[trial_idx]
-                    gaussian_params_out.append(gaussian_params_in[start_idx:end_idx, :])
-                    peak_params_out.append(peak_params_in[start_idx:end_idx, :])
-
-                metadata_fooof_hdf5[unique_attr_label_gaussian_params] = gaussian_params_out
-                metadata_fooof_hdf5[unique_attr_label_peak_params] = peak_params_out
+            # only the peak counts need unpacking, skip decoding all other labels
+            if not unique_attr_label.startswith("n_peaks__"):
+                continue
+            _, trial_idx, call_idx = decode_unique_md_label(unique_attr_label)
+            n_peaks = v
+            SPYParallelLog(
+                f"FOOOF detected {n_peaks} peaks in data of trial {trial_idx} call {call_idx}.",
+                loglevel="DEBUG",
+            )
+            unique_attr_label_gaussian_params = encode_unique_md_label("gaussian_params", trial_idx, call_idx)
+            unique_attr_label_peak_params = encode_unique_md_label("peak_params", trial_idx, call_idx)
+            # the stacked rows belong to the channels in order, split
+            # them at the cumulative peak counts
+            channel_bounds = np.cumsum(n_peaks)[:-1]
+            metadata_fooof_hdf5[unique_attr_label_gaussian_params] = np.split(
+                metadata_fooof_hdf5[unique_attr_label_gaussian_params], channel_bounds, axis=0
+            )
+            metadata_fooof_hdf5[unique_attr_label_peak_params] = np.split(
+                metadata_fooof_hdf5[unique_attr_label_peak_params], channel_bounds, axis=0
+            )
         return metadata_fooof_hdf5
@@ -206,7 +206,7 @@ def freqanalysis(
         but may be unbounded (e.g., ``[-np.inf, 60.5]`` is valid). Edges `fmin`
         and `fmax` are included in the selection. If `foilim` is `None` or
         ``foilim = "all"``, all frequencies are selected.
-    pad : 'maxperlen', float or 'nextpow2'
+    pad : 'maxperlen', float, 'nextpow2' or 'nextfastlen'
         For the default `maxperlen`, no padding is performed in case of equal
         length trials, while trials of varying lengths are padded to match the
         longest trial. If `pad` is a number all trials are padded so that `pad` indicates
@@ -214,7 +214,9 @@ def freqanalysis(
         ``pad = 2`` pads all trials to an absolute length of 2000 samples, if and
         only if the longest trial contains at maximum 2000 samples and the
         samplerate is 1kHz. If `pad` is `'nextpow2'` all trials are padded to the
-        nearest power of two (in samples) of the longest trial.
+        nearest power of two (in samples) of the longest trial. For
+        `'nextfastlen'` all trials are padded to the nearest length (in samples)
+        for which the FFT is efficient, typically much shorter than `'nextpow2'`.
     polyremoval : int or None
         Order of polynomial used for de-trending data in the time domain prior
         to spectral analysis. A value of 0 corresponds to subtracting the mean
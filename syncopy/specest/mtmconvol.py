@@ -7,11 +7,10 @@
 import numpy as np
 import logging
 import platform
-from scipy import signal
 
 # local imports
 from .stft import stft
-from ._norm_spec import _norm_taper
+from ._norm_spec import _get_tapers
 
 
 def mtmconvol(
@@ -91,15 +90,12 @@ def mtmconvol(
 
     # FFT frequencies from the window size
     freqs = np.fft.rfftfreq(nperseg, 1 / samplerate)
-    nFreq = freqs.size
     # frequency bins
     dFreq = freqs[1] - freqs[0]
 
     if taper is None:
         taper = "boxcar"
 
-    taper_func = getattr(signal.windows, taper)
-
     if taper_opt is None:
         taper_opt = {}
 
@@ -110,11 +106,10 @@ def mtmconvol(
     if taper == "dpss":
         taper_opt["sym"] = False
 
-    # only truly 2d for multi-taper "dpss"
-    windows = np.atleast_2d(taper_func(nperseg, **taper_opt))
-
-    # normalize window(s)
-    windows = _norm_taper(taper, windows, nperseg)
+    # only truly 2d for multi-taper "dpss", normalized window(s)
+    windows = _get_tapers(taper, nperseg, nperseg, taper_opt)
+    # single precision data stays single precision throughout the stft
+    windows = windows.astype(np.result_type(data_arr.dtype, np.float32), copy=False)
 
     # number of time points in the output
     if boundary is None:
@@ -125,28 +120,26 @@ def mtmconvol(
         # the whole signal
         nTime = int(np.ceil(nSamples / (nperseg - noverlap)))
 
-    # Short time Fourier transforms (nTime x nTapers x nFreq x nChannels)
-    ftr = np.zeros((nTime, windows.shape[0], nFreq, nChannels), dtype="complex64")
-
     logger = logging.getLogger("syncopy_" + platform.node())
     logger.debug(
         f"Running mtmconvol on {len(windows)} windows, data chunk has {nSamples} samples and {nChannels} channels."
     )
 
-    for taperIdx, win in enumerate(windows):
-        # ftr has shape (nFreq, nChannels, nTime)
-        pxx, _, _ = stft(
-            data_arr,
-            samplerate,
-            window=win,
-            nperseg=nperseg,
-            noverlap=noverlap,
-            boundary=boundary,
-            padded=padded,
-            axis=0,
-            detrend=detrend,
-        )
-
-        ftr[:, taperIdx, ...] = pxx.transpose(2, 0, 1)[:nTime, ...]
+    # segment the data only once and apply all tapers at once,
+    # pxx has shape (nFreq, nTapers, nChannels, nTime)
+    pxx, _, _ = stft(
+        data_arr,
+        samplerate,
+        window=windows,
+        nperseg=nperseg,
+        noverlap=noverlap,
+        boundary=boundary,
+        padded=padded,
+        axis=0,
+        detrend=detrend,
+    )
+
+    # Short time Fourier transforms (nTime x nTapers x nFreq x nChannels)
+    ftr = pxx.transpose(3, 1, 0, 2)[:nTime, ...].astype(np.complex64)
 
     return ftr, freqs
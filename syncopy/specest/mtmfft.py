@@ -5,12 +5,47 @@
 
 # Builtin/3rd party package imports
 import numpy as np
-from scipy import signal
+import scipy.fft as sfft
 import logging
 import platform
 
 # local imports
-from ._norm_spec import _norm_spec, _norm_taper
+from ._norm_spec import _norm_spec, _get_tapers
+from syncopy.shared.dask_helpers import fft_workers
+
+# use pyFFTW for the transforms if available, otherwise `scipy.fft`
+try:
+    import pyfftw.interfaces.cache
+    import pyfftw.interfaces.scipy_fft as fftw_fft
+
+    # keep recently used plans (and their buffers) alive only briefly
+    pyfftw.interfaces.cache.enable()
+    _use_fftw = True
+except ImportError:
+    _use_fftw = False
+
+
+def _rfft(tapered, nSamples):
+    """
+    Real FFT along the last axis of `tapered`, padded to `nSamples`.
+    `tapered` is a scratch array and may get overwritten.
+
+    pyFFTW plans with `FFTW_ESTIMATE`, measured plans would have to be
+    recomputed for every new trial length, which costs far more than
+    the transforms themselves.
+    """
+    workers = fft_workers()
+    if not _use_fftw:
+        return sfft.rfft(tapered, n=nSamples, axis=-1, workers=workers, overwrite_x=True)
+
+    return fftw_fft.rfft(
+        tapered,
+        n=nSamples,
+        axis=-1,
+        workers=workers,
+        overwrite_x=True,
+        planner_effort="FFTW_ESTIMATE",
+    )
 
 
 def mtmfft(
@@ -69,6 +104,11 @@ def mtmfft(
     The FFT result is normalized such that this yields the
     spectral power. For a clean harmonic this will give a
     peak power of `A**2 / 2`, with `A` as harmonic amplitude.
+
+    If `pyFFTW <https://pyfftw.readthedocs.io>`_ is installed it
+    is used for the transforms. Plans are built with `FFTW_ESTIMATE`
+    and briefly kept in the pyFFTW interfaces cache, so consecutive
+    transforms of identical shape re-use them.
     """
 
     # attach dummy channel axis in case only a
@@ -84,7 +124,6 @@ def mtmfft(
     nChannels = data_arr.shape[1]
 
     freqs = np.fft.rfftfreq(nSamples, 1 / samplerate)
-    nFreq = freqs.size
 
     # no taper is boxcar
     if taper is None:
@@ -93,38 +132,39 @@ def mtmfft(
     if taper_opt is None:
         taper_opt = {}
 
-    taper_func = getattr(signal.windows, taper)
     # only really 2d if taper='dpss' with Kmax > 1
     # here we take the actual signal lengths!
-    windows = np.atleast_2d(taper_func(signal_length, **taper_opt))
     # normalize window with total (after padding) length
-    windows = _norm_taper(taper, windows, nSamples)
-
-    # Fourier transforms (nTapers x nFreq x nChannels)
-    ftr = np.zeros((windows.shape[0], nFreq, nChannels), dtype="complex64")
+    windows = _get_tapers(taper, signal_length, nSamples, taper_opt)
+    # match the precision of the data, scipy.fft preserves
+    # single precision so float32 input yields complex64 transforms
+    windows = windows.astype(np.result_type(data_arr.dtype, np.float32), copy=False)
 
     logger = logging.getLogger("syncopy_" + platform.node())
     logger.debug(
         f"Running mtmfft on {len(windows)} windows, data chunk has {nSamples} samples and {nChannels} channels."
     )
 
-    for taperIdx, win in enumerate(windows):
-        win = np.tile(win, (nChannels, 1)).T
-        win *= data_arr
-        # de-mean again after tapering - needed for Granger!
-        if demean_taper:
-            win -= win.mean(axis=0)
-        ftr[taperIdx] = np.fft.rfft(win, n=nSamples, axis=0)
-        # FT uses potentially padded length `nSamples`, which dilutes the power
-        if ft_compat:
-            ftr[taperIdx] = _norm_spec(ftr[taperIdx], nSamples, samplerate)
-        # here the normalization adapts such that padding is NOT changing power
-        else:
-            ftr[taperIdx] = _norm_spec(
-                ftr[taperIdx],
-                signal_length * np.sqrt(nSamples / signal_length),
-                samplerate,
-            )
+    # broadcast all tapers against all channels at once, tapered signals
+    # are C-contiguous with shape (nTapers x nChannels x signal_length)
+    # such that the FFTs run along the contiguous last axis
+    tapered = windows[:, np.newaxis, :] * data_arr.T[np.newaxis, ...]
+    # de-mean again after tapering - needed for Granger!
+    # the means of the tapered signals are just a (BLAS) matrix product
+    # of tapers and data, so no extra reduction pass over `tapered`
+    if demean_taper:
+        tapered -= (windows @ data_arr)[..., np.newaxis] / signal_length
+
+    # Fourier transforms (nTapers x nFreq x nChannels)
+    ftr = _rfft(tapered, nSamples).astype(np.complex64, copy=False)
+    ftr = ftr.transpose(0, 2, 1)
+
+    # FT uses potentially padded length `nSamples`, which dilutes the power
+    if ft_compat:
+        ftr = _norm_spec(ftr, nSamples, samplerate)
+    # here the normalization adapts such that padding is NOT changing power
+    else:
+        ftr = _norm_spec(ftr, signal_length * np.sqrt(nSamples / signal_length), samplerate)
 
     return ftr, freqs
 
@@ -1,16 +1,24 @@
 # -*- coding: utf-8 -*-
 #
-# Short-time Fourier transform, uses np.fft as backend
+# Short-time Fourier transform, uses scipy.fft as backend
 #
 
 # Builtin/3rd party package imports
 import numpy as np
-import scipy.signal as sci_sig
+import scipy.fft as sfft
 import logging
 import platform
 
 # local imports
 from ._norm_spec import _norm_spec
+from syncopy.shared.dask_helpers import fft_workers
+from syncopy.shared.tools import detrend as _detrend
+
+# upper bound for the intermediate segment copies, in bytes
+_BLOCK_BYTES = 64 * 1024**2
+
+# polynomial orders of the `detrend` types
+_DETREND_ORDER = {"constant": 0, "linear": 1}
 
 
 def stft(
@@ -38,9 +46,11 @@ def stft(
         per default
     fs : float
         Samplerate in Hz
-    window : (M,) :class:`numpy.ndarray` or None, optional
+    window : (M,) or (L, M) :class:`numpy.ndarray` or None, optional
         Taper to be multiplied with the
-        signal segments, has to be of length `nperseg`
+        signal segments, has to be of length `nperseg`.
+        For a stack of `L` tapers the segments get computed only once,
+        and an additional leading taper axis is returned
     nperseg : int, optional
         Length of each segment. Defaults to 256.
     noverlap : int, optional
@@ -54,7 +64,7 @@ def stft(
         lost on each side of the input signal. Defaults to `'zeros'`
     detrend : str or `False`, optional
         Optional detrending of the individual segments.
-        Sets `type` argument of :func: `~scipy.signal.detrend`,
+        Same types as for :func: `~scipy.signal.detrend`,
         acceptable are either `'constant'` or `'linear'`.
         Defaults to  `False` such that no detrending is done.
     padded : bool, optional
@@ -72,7 +82,8 @@ def stft(
     -------
     ftr : :class:`numpy.ndarray`
         Short-time fourier transform of the input `dat`
-        Per default the first axis corresponds to the segment times
+        Per default the first axis corresponds to the frequencies,
+        for a 2d `window` the second axis indexes the tapers
     freqs : :class:`numpy.ndarray`
         Array of sampling frequencies
     times : :class:`numpy.ndarray`
@@ -96,25 +107,27 @@ def stft(
         if axis != -1:
             dat = np.moveaxis(dat, axis, -1)
 
-    # extend along time axis to fit in
-    # sliding windows at the edges
-    if boundary is not None:
-        zeros_shape = list(dat.shape)
-        zeros_shape[-1] = nperseg // 2
-        zeros = np.zeros(zeros_shape, dtype=dat.dtype)
-        dat = np.concatenate((zeros, dat, zeros), axis=-1)
-
     # defaults to half window overlap
     if noverlap is None:
         noverlap = nperseg // 2
     nstep = nperseg - noverlap
 
+    # extend along time axis to fit in
+    # sliding windows at the edges
+    nBoundary = nperseg // 2 if boundary is not None else 0
+    nTotal = dat.shape[-1] + 2 * nBoundary
+
     if padded:
         # Pad to integer number of windowed segments
         # I.e make x.shape[-1] = nperseg + (nseg-1)*nstep, with integer nseg
-        nadd = (-(dat.shape[-1] - nperseg) % nstep) % nperseg
-        zeros_shape = list(dat.shape[:-1]) + [nadd]
-        dat = np.concatenate((dat, np.zeros(zeros_shape)), axis=-1)
+        nTotal += (-(nTotal - nperseg) % nstep) % nperseg
+
+    # copy once into a single zero buffer instead of
+    # concatenating zero blocks to both ends
+    if nTotal != dat.shape[-1]:
+        padded_dat = np.zeros(dat.shape[:-1] + (nTotal,), dtype=dat.dtype)
+        padded_dat[..., nBoundary : nBoundary + dat.shape[-1]] = dat
+        dat = padded_dat
 
     # Create strided array of data segments
     if nperseg == 1 and noverlap == 0:
@@ -127,13 +140,10 @@ def stft(
         dat = np.lib.stride_tricks.as_strided(dat, shape=shape, strides=strides)
     # dat now has shape (nChannels, nSamples, nperseg)
 
-    # detrend each segment separately
-    if detrend:
-        dat = sci_sig.detrend(dat, type=detrend, overwrite_data=True)
-
-    if window is not None:
-        # Apply window by multiplication
-        dat = dat * window
+    if window is not None and window.ndim > 1:
+        # Apply all tapers in one go:
+        # (nTaper, nChannels, nSegments, nperseg)
+        window = window.reshape(window.shape[:1] + (1,) * (dat.ndim - 1) + window.shape[1:])
 
     logger = logging.getLogger("syncopy_" + platform.node())
     pad_status = "with padding" if padded else "without padding"
@@ -147,8 +157,34 @@ def stft(
 
     freqs = np.fft.rfftfreq(nperseg, 1 / fs)
 
-    # the complex transforms
-    ftr = np.fft.rfft(dat, axis=-1)
+    workers = fft_workers()
+
+    def _transform(segments):
+        # detrend each segment separately, the (strided) segments may
+        # share memory with the input so they can't be overwritten
+        if detrend:
+            segments = _detrend(segments, order=_DETREND_ORDER[detrend], axis=-1)
+        if window is not None:
+            # Apply window by multiplication
+            segments = segments * window
+        # the complex transforms, batched over channels (and tapers)
+        return sfft.rfft(segments, axis=-1, workers=workers)
+
+    # process blocks of segments to cap the size of the
+    # detrended/windowed copies of the (overlapping) segments
+    nSegments = dat.shape[-2]
+    outShape = dat.shape[:-1] + (freqs.size,)
+    if window is not None and window.ndim > 1:
+        outShape = window.shape[:1] + outShape
+    segBytes = np.prod(outShape[:-2], dtype=np.int64) * nperseg * 16
+    blockSize = max(1, int(_BLOCK_BYTES // segBytes))
+
+    if blockSize >= nSegments:
+        ftr = _transform(dat)
+    else:
+        ftr = np.empty(outShape, dtype=np.result_type(dat.dtype, np.complex64))
+        for start in range(0, nSegments, blockSize):
+            ftr[..., start : start + blockSize, :] = _transform(dat[..., start : start + blockSize, :])
 
     # normalization to power -> squared amplitude / 2
     ftr = _norm_spec(ftr, nperseg, fs)
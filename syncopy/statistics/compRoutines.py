@@ -228,8 +228,8 @@ class Covariance(ComputationalRoutine):
 
         # Attach remaining meta-data
         out.samplerate = data.samplerate
-        out.channel_i = np.array(data.channel[chanSec])
-        out.channel_j = np.array(data.channel[chanSec])
+        out.channel_i = data.channel[chanSec]
+        out.channel_j = data.channel[chanSec]
 
 
 @process_io
@@ -162,13 +162,14 @@ def phase_diffusion(
 
     tvec = np.linspace(0, nSamples / samplerate, nSamples, dtype="f4")
     omega0 = 2 * np.pi * freq
-    lin_phase = np.tile(omega0 * tvec, (nChannels, 1)).T
+    # (nSamples x 1), gets broadcasted against the channels
+    lin_phase = (omega0 * tvec)[:, np.newaxis]
 
     # randomize initial phase
     if rand_ini:
         rng = np.random.default_rng(seed)
         ps0 = 2 * np.pi * rng.uniform(size=nChannels).astype("f4")
-        lin_phase += ps0
+        lin_phase = lin_phase + ps0
 
     # relative Brownian increments
     rel_eps = np.sqrt(omega0 / samplerate * eps)
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 import matplotlib.pyplot as ppl
 from scipy.signal import windows
 
@@ -448,3 +449,19 @@ def test_mtmfft():
         except TypeError:
             # we didn't provide default parameters..
             pass
+
+
+def test_mtmfft_fftw_unequal_trials(monkeypatch):
+
+    pytest.importorskip("pyfftw")
+
+    rng = np.random.default_rng(42)
+    taper_opt = {"Kmax": 3, "NW": 2}
+    for nSamples in [500, 731, 1000]:
+        trial = rng.standard_normal((nSamples, 4)).astype(np.float32)
+        res = {}
+        for use_fftw in [True, False]:
+            monkeypatch.setattr(mtmfft, "_use_fftw", use_fftw)
+            res[use_fftw], freqs = mtmfft.mtmfft(trial, fs, nSamples=1024, taper="dpss", taper_opt=taper_opt)
+        assert res[True].shape == (3, freqs.size, 4)
+        assert np.allclose(res[True], res[False], atol=1e-5)
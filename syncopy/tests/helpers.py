@@ -24,7 +24,7 @@ def run_padding_test(method_call, pad_length):
     a single keyword argument `pad`
     """
 
-    pad_options = [pad_length, "nextpow2", "maxperlen"]
+    pad_options = [pad_length, "nextpow2", "nextfastlen", "maxperlen"]
     for pad in pad_options:
         method_call(pad=pad)
 
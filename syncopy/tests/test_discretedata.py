@@ -257,6 +257,12 @@ class TestEventData:
         assert dummy.trialinfo.shape == (1, 0)
         assert np.array_equal(dummy.data, self.data)
 
+        # cached event codes get updated with new data
+        newData = self.data.copy()
+        newData[0, 1] = 7
+        dummy.data = newData
+        assert np.array_equal(dummy.eventid, [0, 1, 7])
+
         # wrong shape for data-type
         with pytest.raises(SPYValueError):
             EventData(np.ones((3,)))
@@ -293,6 +293,26 @@ class TestMetadataUsingFooof:
             assert k in spec_dt.metadata
         assert len(spec_dt.metadata) == len(spy.specest.compRoutines.FooofSpy.metadata_keys)
 
+    def test_decode_peak_params_per_channel(self):
+        """
+        Test that the stacked peak parameters get split back into their channels.
+        """
+        FooofSpy = spy.specest.compRoutines.FooofSpy
+        gaussian_params = [np.full((n, 3), chan, dtype=float) for chan, n in enumerate([2, 0, 3])]
+        peak_params = [gp + 10 for gp in gaussian_params]
+        md = FooofSpy.encode_singletrial_metadata_fooof_for_hdf5(
+            {"gaussian_params": gaussian_params, "peak_params": peak_params}
+        )
+        md_hdf5 = {
+            "n_peaks__0_0": np.array([2, 0, 3]),
+            "gaussian_params__0_0": md["gaussian_params"],
+            "peak_params__0_0": md["peak_params"],
+        }
+        md_hdf5 = FooofSpy.decode_metadata_fooof_alltrials_from_hdf5(md_hdf5)
+        for chan in range(3):
+            assert np.array_equal(md_hdf5["gaussian_params__0_0"][chan], gaussian_params[chan])
+            assert np.array_equal(md_hdf5["peak_params__0_0"][chan], peak_params[chan])
+
     def test_par_compute_with_sequential_storage(self):
         """
         Test metadata propagation in with parallel compute and sequential storage.
@@ -5,6 +5,9 @@
 
 # Builtin/3rd party package imports
 import os
+import sys
+import json
+import hashlib
 import tempfile
 import shutil
 import h5py
@@ -135,6 +138,38 @@ class TestSpyIO:
                     load(dname, checksum=True)
                 shutil.rmtree(dname + ".spy")
 
+    # Test checksum matching of containers written with a different algorithm
+    def test_checksum_algorithm(self):
+        with tempfile.TemporaryDirectory() as tdir:
+            dname = os.path.join(tdir, "dummy")
+            dummy = AnalogData(self.data["AnalogData"], samplerate=1000)
+            save(dummy, dname)
+            hname = dummy._filename
+            del dummy
+
+            # pretend the container was saved using SHA1
+            infoFile = hname + FILE_EXT["info"]
+            with open(infoFile, "r") as file:
+                jsonDict = json.load(file)
+            with open(hname, "rb") as file:
+                jsonDict["file_checksum"] = hashlib.sha1(file.read()).hexdigest()
+            jsonDict["checksum_algorithm"] = hashlib.sha1.__name__
+            with open(infoFile, "w") as file:
+                json.dump(jsonDict, file)
+
+            # checksum-matching has to use the stored algorithm
+            dummy2 = load(dname, checksum=True)
+            del dummy2
+
+            # containers hashed with BLAKE3 can't be verified without the `blake3` package
+            jsonDict["checksum_algorithm"] = "blake3"
+            with open(infoFile, "w") as file:
+                json.dump(jsonDict, file)
+            with pytest.MonkeyPatch.context() as mp:
+                mp.setitem(sys.modules, "blake3", None)
+                with pytest.raises(SPYError, match="blake3"):
+                    load(dname, checksum=True)
+
     # Test correct handling of user-provided file-names
     def test_save_fname(self):
         for dclass in self.classes:
@@ -602,6 +637,10 @@ class TestTDTImporter:
         # check that it wasn't 0 before
         assert not np.allclose(np.median(AData.data), 0)
 
+        # direct reads without memory-mapping give the same data
+        AData3 = load_tdt(self.tdt_dir, use_memmap=False)
+        assert np.array_equal(AData3.data[()], AData.data[()])
+
         # test automatic trialdefinition
         AData = load_tdt(self.tdt_dir, self.start_code, self.end_code)
         assert len(AData.trials) == 659
@@ -623,6 +662,9 @@ class TestTDTImporter:
         with pytest.raises(SPYValueError, match="Invalid value of `end_code`"):
             load_tdt(self.tdt_dir, start_code=self.start_code, end_code=999999)
 
+        with pytest.raises(SPYTypeError, match="use_memmap"):
+            load_tdt(self.tdt_dir, use_memmap="yes")
+
 
 if __name__ == "__main__":
     T0 = TestSpyIO()
@@ -6,9 +6,10 @@
 # Builtin/3rd party package imports
 import numpy as np
 import pytest
+from scipy import signal
 
 # Local imports
-from syncopy.shared.tools import best_match
+from syncopy.shared.tools import best_match, detrend
 from syncopy.shared.errors import SPYValueError
 
 
@@ -86,3 +87,23 @@ class TestBestMatch:
                     [elem for elem in source if selection.min() <= elem <= selection.max()]
                 )
                 expectedIdx = np.array([np.where(source == elem)[0][0] for elem in expectedVal])
+
+
+def test_detrend():
+
+    rng = np.random.default_rng(42)
+    data = rng.standard_normal((500, 4)) + np.arange(500)[:, None] * [0.1, -2, 0, 5]
+
+    for order, dtype in enumerate(["constant", "linear"]):
+        expected = signal.detrend(data, type=dtype, axis=0)
+        assert np.allclose(detrend(data, order=order, axis=0), expected)
+        assert np.allclose(detrend(data.T, order=order, axis=-1), expected.T)
+        # integer data gets promoted
+        res = detrend(data.astype(np.int32), order=order)
+        assert res.dtype == np.float64
+        assert np.allclose(res, signal.detrend(data.astype(np.int32), type=dtype, axis=0))
+
+    # input stays untouched
+    before = data.copy()
+    detrend(data, order=1)
+    assert np.array_equal(data, before)